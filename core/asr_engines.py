@@ -3,19 +3,197 @@ ASR (Automatic Speech Recognition) Engines module
 Supports Google Speech Recognition and Whisper
 """
 
+import importlib.util
 import re
-from difflib import SequenceMatcher
+import threading
+import unicodedata
+from functools import lru_cache
+from itertools import zip_longest
+
+import numpy as np
 from PyQt5.QtCore import QThread, pyqtSignal
+from rapidfuzz import process
+from rapidfuzz.distance import Indel, Levenshtein
+
+
+# Precompiled text normalization patterns
+_PUNCT_RE = re.compile(r'[^\w\s]')
+_WS_RE = re.compile(r'\s+')
+# ASCII fast path: delete exactly the ASCII characters _PUNCT_RE would remove
+_ASCII_PUNCT_TABLE = str.maketrans(
+    '', '', ''.join(c for c in map(chr, range(128)) if _PUNCT_RE.match(c))
+)
+
+
+def _strip_punctuation(text):
+    """Remove punctuation, preserving letters of every script"""
+    if text.isascii():
+        return text.translate(_ASCII_PUNCT_TABLE)
+    return _PUNCT_RE.sub('', text)
 
 
 # Model caches - load once and reuse
 _whisper_model_cache = {}
 _qwen_model_cache = {}
+# Guards the caches and _model_load_locks; never held during a load
+_model_cache_lock = threading.Lock()
+# One lock per model key, held while that model loads, so a background
+# warm-up and a transcription asking for the same model never load it twice
+# while requests for other models go ahead
+_model_load_locks = {}
+
+
+def _get_cached_model(cache, key, load):
+    """Return cache[key], calling load() under a per-key lock on a miss"""
+    with _model_cache_lock:
+        model = cache.get(key)
+        if model is not None:
+            return model
+        load_lock = _model_load_locks.setdefault((id(cache), key), threading.Lock())
+    with load_lock:
+        with _model_cache_lock:
+            model = cache.get(key)
+        if model is None:
+            model = load()
+            with _model_cache_lock:
+                cache[key] = model
+        return model
+
+
+def _get_whisper_model(model_name):
+    """Return the cached faster-whisper model, loading it on first use"""
+
+    def load():
+        import ctranslate2
+        from faster_whisper import WhisperModel
+
+        # INT8 weights halve the bytes moved per decoded token
+        if ctranslate2.get_cuda_device_count() > 0:
+            device, compute_type = "cuda", "int8_float16"
+        else:
+            device, compute_type = "cpu", "int8"
+        return WhisperModel(model_name, device=device, compute_type=compute_type)
+
+    return _get_cached_model(_whisper_model_cache, model_name, load)
+
+
+def _get_qwen_model(config):
+    """Return the cached Qwen3-ASR model for config, loading it on first use"""
+    import torch
+
+    # Auto-detect GPU availability
+    device = "cuda" if torch.cuda.is_available() else "cpu"
+
+    # Get the model identifier from config
+    model_name_short = config['model']  # e.g., 'Qwen3-ASR-1.7B'
+
+    # Map short name to model configuration
+    if model_name_short == 'Qwen3-ASR-1.7B':
+        model_size = '1.7B'
+    elif model_name_short == 'Qwen3-ASR-0.6B':
+        model_size = '0.6B'
+    else:
+        raise ValueError(f"Unknown Qwen3-ASR model: {model_name_short}")
+
+    # Weight quantization ('int8', 'int4' or 'none') only applies on CUDA,
+    # where decoding is bound by the bytes of weights read per token
+    qwen_settings = config.get('asr_engine_settings', {}).get('Qwen3-ASR', {})
+    quant_mode = qwen_settings.get('quantization', 'int8')
+    if device != "cuda" or importlib.util.find_spec("bitsandbytes") is None:
+        quant_mode = 'none'
+
+    # Create cache key based on model size, device and quantization
+    cache_key = (model_size, device, quant_mode)
+
+    def load():
+        from qwen_asr import Qwen3ASRModel
+
+        load_kwargs = {
+            'device_map': device,
+            'dtype': torch.float16 if device == "cuda" else torch.float32
+        }
+        if quant_mode in ('int8', 'int4'):
+            from transformers import BitsAndBytesConfig
+
+            if quant_mode == 'int8':
+                quant_config = BitsAndBytesConfig(load_in_8bit=True)
+            else:
+                quant_config = BitsAndBytesConfig(
+                    load_in_4bit=True, bnb_4bit_compute_dtype=torch.float16
+                )
+            load_kwargs['quantization_config'] = quant_config
+
+        # Load the Qwen3-ASR model
+        # The first time this is called, it will download the model.
+        # This might take a while, but subsequent calls will use cached versions.
+        model = Qwen3ASRModel.from_pretrained(
+            f"Qwen/Qwen3-ASR-{model_size}", **load_kwargs
+        )
+        if device == "cuda" and qwen_settings.get('torch_compile', False):
+            _compile_qwen_model(model)
+        return model
+
+    return _get_cached_model(_qwen_model_cache, cache_key, load)
+
+
+def _compile_qwen_model(model):
+    """
+    Fuse the decoder's many small eager kernels with torch.compile.
+    The one-off compilation happens on the first transcription and is kept
+    with the cached model; if the wrapper exposes no torch module, the model
+    is left running eagerly.
+    """
+    import torch
+
+    module = getattr(model, 'model', None)
+    if isinstance(module, torch.nn.Module):
+        try:
+            module.forward = torch.compile(
+                module.forward, mode="reduce-overhead", fullgraph=False
+            )
+        except Exception as e:
+            print(f"[DEBUG] torch.compile unavailable for Qwen3-ASR: {e}")
+
+
+def prewarm_model(config):
+    """
+    Load the model for the configured ASR engine into the cache ahead of the
+    first transcription. Meant to run on a background thread; errors are
+    reported when the engine is actually used, so they are only logged here.
+    """
+    try:
+        if config.get('engine') == "Whisper":
+            _get_whisper_model(config['model'])
+        elif config.get('engine') == "Qwen3-ASR":
+            _get_qwen_model(config)
+    except Exception as e:
+        print(f"[DEBUG] ASR model warm-up failed: {e}")
+
+
+# Deletion table for every combining character in the Basic Multilingual
+# Plane, so str.translate can strip diacritics in C
+_COMBINING_TABLE = dict.fromkeys(
+    c for c in range(0x10000) if unicodedata.combining(chr(c))
+)
+
+
+@lru_cache(maxsize=4096)
+def _remove_accents(text):
+    """Strip combining diacritics; memoized since flashcards repeat the same words"""
+    # Normalize to decomposed form (NFD) to separate base characters from diacritics
+    nfd = unicodedata.normalize('NFD', text)
+    # Filter out combining characters (diacritics); the table only covers the
+    # BMP, so rare astral-plane text takes the per-character path
+    if not nfd or max(nfd) <= '\uffff':
+        return nfd.translate(_COMBINING_TABLE)
+    return ''.join(char for char in nfd if not unicodedata.combining(char))
 
 
 class ASRThread(QThread):
     """Thread for ASR processing with multiple engine support"""
     finished = pyqtSignal(str, dict)
+    # Emitted as soon as the transcript exists, before pronunciation analysis
+    transcription_ready = pyqtSignal(str, dict)
     error = pyqtSignal(str)
 
     def __init__(self, audio_file, config, show_punctuation, show_word_time, reference_text=None):
@@ -42,6 +220,8 @@ class ASRThread(QThread):
 
             # Add pronunciation analysis if reference text provided
             if self.reference_text:
+                # Let the UI show the transcript while the analysis runs
+                self.transcription_ready.emit(result['text'], result.get('metadata', {}))
                 pronunciation_result = self.analyze_pronunciation(
                     self.reference_text, result['text']
                 )
@@ -96,38 +276,45 @@ class ASRThread(QThread):
             raise Exception(f"Google Speech Recognition connection error: {str(e)}")
 
     def whisper_asr(self):
-        """OpenAI Whisper implementation"""
-        import whisper
-
-        model_name = self.config['model']
-        # Use cached model if available
-        if model_name not in _whisper_model_cache:
-            _whisper_model_cache[model_name] = whisper.load_model(model_name)
-        model = _whisper_model_cache[model_name]
+        """Whisper implementation using the faster-whisper (CTranslate2) backend"""
+        model = _get_whisper_model(self.config['model'])
         lang_code = self.config['language'][:2]
 
-        result = model.transcribe(
+        decode_options = {}
+        if self.reference_text and not self.show_word_time:
+            # Pronunciation practice clips are a few seconds of one known
+            # phrase: greedy decoding without timestamp tokens is enough and
+            # avoids the cost of a 5-way beam search
+            decode_options = {
+                'beam_size': 1,
+                'without_timestamps': True,
+                'condition_on_previous_text': False,
+            }
+
+        # transcribe() returns a lazy generator; decoding happens while iterating
+        segments, _info = model.transcribe(
             self.audio_file,
             language=lang_code,
-            word_timestamps=self.show_word_time
+            word_timestamps=self.show_word_time,
+            **decode_options
         )
+        segments = list(segments)
 
-        text = result['text']
+        text = ''.join(segment.text for segment in segments)
 
         metadata = {}
-        if self.show_word_time and 'segments' in result:
+        if self.show_word_time:
             timestamps = []
             word_data = []
-            for segment in result['segments']:
-                if 'words' in segment:
-                    for word in segment['words']:
-                        timestamps.append(f"{word['word']} [{word['start']:.2f}s]")
-                        word_data.append({
-                            'word': word['word'],
-                            'start': word['start'],
-                            'end': word.get('end', word['start']),
-                            'probability': word.get('probability', 1.0)
-                        })
+            for segment in segments:
+                for word in segment.words or ():
+                    timestamps.append(f"{word.word} [{word.start:.2f}s]")
+                    word_data.append({
+                        'word': word.word,
+                        'start': word.start,
+                        'end': word.end,
+                        'probability': word.probability
+                    })
             metadata['word_times'] = '\n'.join(timestamps)
             metadata['word_data'] = word_data
 
@@ -135,38 +322,7 @@ class ASRThread(QThread):
 
     def qwen3_asr(self):
         """Qwen3-ASR implementation using the official Qwen3-ASR package"""
-        import torch
-        import librosa
-        from qwen_asr import Qwen3ASRModel
-
-        # Auto-detect GPU availability
-        device = "cuda" if torch.cuda.is_available() else "cpu"
-
-        # Get the model identifier from config
-        model_name_short = self.config['model']  # e.g., 'Qwen3-ASR-1.7B'
-
-        # Map short name to model configuration
-        if model_name_short == 'Qwen3-ASR-1.7B':
-            model_size = '1.7B'
-        elif model_name_short == 'Qwen3-ASR-0.6B':
-            model_size = '0.6B'
-        else:
-            raise ValueError(f"Unknown Qwen3-ASR model: {model_name_short}")
-
-        # Create cache key based on model size and device
-        cache_key = f"{model_size}_{device}"
-
-        # Use cached model if available
-        if cache_key not in _qwen_model_cache:
-            # Load the Qwen3-ASR model
-            # The first time this is called, it will download the model.
-            # This might take a while, but subsequent calls will use cached versions.
-            _qwen_model_cache[cache_key] = Qwen3ASRModel.from_pretrained(
-                f"Qwen/Qwen3-ASR-{model_size}",
-                device_map=device,
-                dtype=torch.float16 if device == "cuda" else torch.float32
-            )
-        model = _qwen_model_cache[cache_key]
+        model = _get_qwen_model(self.config)
 
         # Perform ASR transcription using the Qwen3-ASR model
         # According to the signature, transcribe accepts file paths directly
@@ -226,20 +382,34 @@ class ASRThread(QThread):
 
     def analyze_pronunciation(self, reference, recognized):
         """Analyze pronunciation by comparing reference and recognized text"""
-        import unicodedata
-        
         # Normalize texts (preserving script differences for analysis)
         ref_normalized = self.normalize_text_preserve_case(reference)
         rec_normalized = self.normalize_text_preserve_case(recognized)
 
+        # Fast paths: a perfect match, or nothing recognized at all
+        if ref_normalized == rec_normalized or not rec_normalized:
+            perfect = ref_normalized == rec_normalized
+            return {
+                'accuracy': 100.0 if perfect else 0.0,
+                'word_analysis': [{
+                    'reference': word,
+                    'recognized': word if perfect else "",
+                    'similarity': 100.0 if perfect else 0,
+                    'status': "correct" if perfect else "missing"
+                } for word in ref_normalized.split()],
+                'reference': reference,
+                'recognized': recognized
+            }
+
         # Calculate similarity
         # First try direct comparison
-        direct_similarity = SequenceMatcher(None, ref_normalized, rec_normalized).ratio()
+        # (Indel similarity is 2*LCS/(len(a)+len(b)), the ratio difflib approximates)
+        direct_similarity = Indel.normalized_similarity(ref_normalized, rec_normalized)
         
         # Also try comparing without diacritics/script normalization for Greek
         ref_no_accents = self.remove_accents(ref_normalized)
         rec_no_accents = self.remove_accents(rec_normalized)
-        normalized_similarity = SequenceMatcher(None, ref_no_accents, rec_no_accents).ratio()
+        normalized_similarity = Indel.normalized_similarity(ref_no_accents, rec_no_accents)
         
         # Use the higher similarity score to account for script/diacritic differences
         similarity = max(direct_similarity, normalized_similarity)
@@ -248,43 +418,69 @@ class ASRThread(QThread):
         # Word-level analysis
         ref_words = ref_normalized.split()
         rec_words = rec_normalized.split()
+        # Accent-free forms are computed once per word, not inside the loop
+        ref_words_no_acc = [self.remove_accents(w) for w in ref_words]
+        rec_words_no_acc = [self.remove_accents(w) for w in rec_words]
+
+        # Align the word sequences (on their accent-free forms) so a dropped
+        # or inserted word is reported once instead of shifting every later
+        # pair; each entry is (ref_index, rec_index) with None marking a gap
+        pairs = []
+        opcodes = Levenshtein.opcodes(ref_words_no_acc, rec_words_no_acc)
+        for tag, i1, i2, j1, j2 in opcodes:
+            if tag in ('equal', 'replace'):
+                pairs.extend(zip_longest(range(i1, i2), range(j1, j2)))
+            elif tag == 'delete':
+                pairs.extend((i, None) for i in range(i1, i2))
+            else:
+                pairs.extend((None, j) for j in range(j1, j2))
+
+        # Score every aligned word pair in one C-level call, both as written
+        # and without accents (for Greek text)
+        matched = [(i, j) for i, j in pairs if i is not None and j is not None]
+        word_sims = iter(())
+        if matched:
+            # float64: cpdist defaults to float32, which turns an exact 0.8
+            # into 0.80000001 and flips the "> 0.8" correctness check
+            direct_word_sims = process.cpdist(
+                [ref_words[i] for i, _ in matched],
+                [rec_words[j] for _, j in matched],
+                scorer=Indel.normalized_similarity,
+                dtype=np.float64,
+            )
+            normalized_word_sims = process.cpdist(
+                [ref_words_no_acc[i] for i, _ in matched],
+                [rec_words_no_acc[j] for _, j in matched],
+                scorer=Indel.normalized_similarity,
+                dtype=np.float64,
+            )
+            word_sims = iter(
+                np.maximum(direct_word_sims, normalized_word_sims).tolist()
+            )
 
         word_analysis = []
-        max_len = max(len(ref_words), len(rec_words))
-
-        for i in range(max_len):
-            ref_word = ref_words[i] if i < len(ref_words) else ""
-            rec_word = rec_words[i] if i < len(rec_words) else ""
-
-            if ref_word and rec_word:
-                # Calculate word similarity considering script differences
-                direct_word_sim = SequenceMatcher(None, ref_word, rec_word).ratio()
-                
-                # Also compare without accents for Greek text
-                ref_word_no_acc = self.remove_accents(ref_word)
-                rec_word_no_acc = self.remove_accents(rec_word)
-                normalized_word_sim = SequenceMatcher(None, ref_word_no_acc, rec_word_no_acc).ratio()
-                
-                word_sim = max(direct_word_sim, normalized_word_sim)
-                
+        for i, j in pairs:
+            if i is not None and j is not None:
+                # Word similarity considering script differences
+                word_sim = next(word_sims)
                 status = "correct" if word_sim > 0.8 else "incorrect"
                 word_analysis.append({
-                    'reference': ref_word,
-                    'recognized': rec_word,
+                    'reference': ref_words[i],
+                    'recognized': rec_words[j],
                     'similarity': word_sim * 100,
                     'status': status
                 })
-            elif ref_word:
+            elif i is not None:
                 word_analysis.append({
-                    'reference': ref_word,
+                    'reference': ref_words[i],
                     'recognized': "",
                     'similarity': 0,
                     'status': "missing"
                 })
-            elif rec_word:
+            else:
                 word_analysis.append({
                     'reference': "",
-                    'recognized': rec_word,
+                    'recognized': rec_words[j],
                     'similarity': 0,
                     'status': "extra"
                 })
@@ -298,27 +494,21 @@ class ASRThread(QThread):
 
     def normalize_text_preserve_case(self, text):
         """Normalize text for comparison while preserving script differences"""
-        import re
         # Remove punctuation but preserve all scripts (Greek, Latin, etc.)
         text = text.strip()
-        text = re.sub(r'[^\w\s]', '', text)  # Remove punctuation
-        text = re.sub(r'\s+', ' ', text)  # Normalize whitespace
+        text = _strip_punctuation(text)  # Remove punctuation
+        text = _WS_RE.sub(' ', text)  # Normalize whitespace
         return text.lower()
 
     def remove_accents(self, text):
         """Remove diacritics and accents from text for better Greek comparison"""
-        import unicodedata
-        # Normalize to decomposed form (NFD) to separate base characters from diacritics
-        nfd = unicodedata.normalize('NFD', text)
-        # Filter out combining characters (diacritics)
-        without_accents = ''.join(char for char in nfd if not unicodedata.combining(char))
-        return without_accents
+        return _remove_accents(text)
 
     def normalize_text(self, text):
         """Normalize text for comparison"""
         text = text.lower().strip()
-        text = re.sub(r'[^\w\s]', '', text)  # Remove punctuation
-        text = re.sub(r'\s+', ' ', text)  # Normalize whitespace
+        text = _strip_punctuation(text)  # Remove punctuation
+        text = _WS_RE.sub(' ', text)  # Normalize whitespace
         return text
 
 
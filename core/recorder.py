@@ -3,9 +3,9 @@ Audio recorder module
 Handles audio input and recording
 """
 
+import os
 import tempfile
 import queue
-import numpy as np
 import sounddevice as sd
 import soundfile as sf
 from PyQt5.QtCore import QThread, pyqtSignal
@@ -26,13 +26,16 @@ class RecordThread(QThread):
 
     def run(self):
         try:
-            # Initialize recording buffer
-            recording_buffer = []
+            # Samples are streamed to disk as they arrive, so memory use stays
+            # flat however long the recording runs. The audio callback only
+            # queues chunks; this thread does the (blocking) file writes.
+            self.filename = tempfile.mktemp(suffix='.wav')
+            frames_written = 0
 
             # Callback function to capture audio chunks
             def audio_callback(indata, frames, time, status):
                 if self.is_recording:
-                    recording_buffer.append(indata.copy())
+                    self.audio_queue.put(indata.copy())
 
             # Start the stream
             stream = sd.InputStream(
@@ -42,24 +45,33 @@ class RecordThread(QThread):
                 callback=audio_callback
             )
 
-            stream.start()
+            with sf.SoundFile(self.filename, mode='w', samplerate=self.sample_rate,
+                              channels=1, subtype='PCM_16') as wav_file:
+                stream.start()
 
-            # Keep recording until flag is changed
-            while self.is_recording:
-                sd.sleep(100)  # Sleep for 100ms to avoid busy waiting
+                # Keep recording until flag is changed
+                while self.is_recording:
+                    try:
+                        chunk = self.audio_queue.get(timeout=0.1)
+                    except queue.Empty:
+                        continue
+                    wav_file.write(chunk)
+                    frames_written += len(chunk)
 
-            # Stop the stream
-            stream.stop()
-            stream.close()
+                # Stop the stream
+                stream.stop()
+                stream.close()
 
-            # Combine all recorded chunks
-            if recording_buffer:
-                full_recording = np.concatenate(recording_buffer, axis=0)
+                # Flush chunks captured before the stream stopped
+                while not self.audio_queue.empty():
+                    chunk = self.audio_queue.get_nowait()
+                    wav_file.write(chunk)
+                    frames_written += len(chunk)
 
-                self.filename = tempfile.mktemp(suffix='.wav')
-                sf.write(self.filename, full_recording, self.sample_rate)
+            if frames_written:
                 self.finished.emit(self.filename)
             else:
+                os.remove(self.filename)
                 self.error.emit("No audio recorded")
 
         except Exception as e:
@@ -0,0 +1,98 @@
+"""
+FSRS spaced repetition scheduler
+Implements the FSRS-4.5 difficulty/stability/retrievability model
+(https://github.com/open-spaced-repetition/fsrs4anki) with its default weights
+"""
+
+import math
+
+# Ratings
+AGAIN = 1
+HARD = 2
+GOOD = 3
+EASY = 4
+
+# FSRS-4.5 default parameters
+WEIGHTS = (
+    0.4872, 1.4003, 3.7145, 13.8206, 5.1618, 1.2298, 0.8975, 0.031, 1.6474,
+    0.1367, 1.0461, 2.1072, 0.0793, 0.3246, 1.587, 0.2272, 2.8755,
+)
+DECAY = -0.5
+FACTOR = 0.9 ** (1 / DECAY) - 1  # 19/81: makes retrievability 0.9 at t == S
+
+# Probability of recall the schedule aims for when a card comes due
+DEFAULT_RETENTION = 0.9
+MAX_INTERVAL_DAYS = 36500
+
+
+def _clamp_difficulty(d):
+    return min(10.0, max(1.0, d))
+
+
+def initial_stability(rating, w=WEIGHTS):
+    """Stability in days after the first review"""
+    return max(0.1, w[rating - 1])
+
+
+def initial_difficulty(rating, w=WEIGHTS):
+    """Difficulty (1-10) after the first review"""
+    return _clamp_difficulty(w[4] - (rating - 3) * w[5])
+
+
+def retrievability(elapsed_days, stability):
+    """Probability of recall after elapsed_days for a card with this stability"""
+    return (1 + FACTOR * elapsed_days / stability) ** DECAY
+
+
+def next_interval(stability, retention=DEFAULT_RETENTION):
+    """
+    Days until recall probability falls to retention.
+    Uses only arithmetic, so stability may be a float or a NumPy array;
+    callers round and clamp.
+    """
+    return stability / FACTOR * (retention ** (1 / DECAY) - 1)
+
+
+def next_difficulty(d, rating, w=WEIGHTS):
+    """Difficulty after a review, pulled back toward the default"""
+    d = d - w[6] * (rating - 3)
+    return _clamp_difficulty(w[7] * initial_difficulty(GOOD, w) + (1 - w[7]) * d)
+
+
+def next_stability(s, d, r, rating, w=WEIGHTS):
+    """Stability after a review given difficulty d and retrievability r"""
+    if rating == AGAIN:
+        return max(
+            0.1,
+            w[11] * d ** -w[12] * ((s + 1) ** w[13] - 1) * math.exp(w[14] * (1 - r)),
+        )
+    hard_penalty = w[15] if rating == HARD else 1.0
+    easy_bonus = w[16] if rating == EASY else 1.0
+    return s * (
+        1
+        + math.exp(w[8])
+        * (11 - d)
+        * s ** -w[9]
+        * (math.exp(w[10] * (1 - r)) - 1)
+        * hard_penalty
+        * easy_bonus
+    )
+
+
+def review(stability, difficulty, elapsed_days, rating):
+    """
+    Apply one review and return the new (stability, difficulty).
+    Pass stability=None for a card that has never been reviewed.
+    """
+    if stability is None:
+        return initial_stability(rating), initial_difficulty(rating)
+    r = retrievability(max(0.0, elapsed_days), stability)
+    return (
+        next_stability(stability, difficulty, r, rating),
+        next_difficulty(difficulty, rating),
+    )
+
+
+def interval_days(stability, retention=DEFAULT_RETENTION):
+    """Whole days until the next review, at least one"""
+    return int(min(MAX_INTERVAL_DAYS, max(1, round(next_interval(stability, retention)))))
@@ -3,14 +3,41 @@ TTS (Text-to-Speech) Engines module
 Supports gTTS and placeholders for future TTS engines
 """
 
+import hashlib
 import io
+import os
 import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
 import pygame
 from gtts import gTTS
 from PyQt5.QtCore import QThread, pyqtSignal
 
 
+# How often playback completion is checked (was 100 ms)
+_PLAYBACK_POLL_MS = 10
+
+# gTTS audio cache: (text, language, slow) -> MP3 bytes, backed by files on disk.
+# Kept in least-recently-used order and trimmed to a byte budget
+_gtts_cache = OrderedDict()
+_gtts_cache_bytes = 0
+_GTTS_MEMORY_CACHE_MAX_BYTES = 32 * 1024 * 1024
+_gtts_cache_lock = threading.Lock()
+_GTTS_CACHE_DIR = Path.home() / ".cache" / "asr-app" / "tts"
+# Disk cache cap; least recently used files are removed beyond this
+_GTTS_CACHE_MAX_BYTES = 500 * 1024 * 1024
+_gtts_cache_disk_bytes = None  # Size of the disk cache, measured on first write
+
+
+@lru_cache(maxsize=16)
+def tts_language_code(language):
+    """Primary subtag of a locale such as 'el-GR', as TTS engines expect ('el')"""
+    return language.split("-", 1)[0].lower()
+
+
 class TTSBase:
     """Base class for TTS engines"""
 
@@ -23,6 +50,103 @@ class TTSBase:
         raise NotImplementedError
 
 
+def _account_gtts_cache_write(size):
+    """Track disk cache growth and evict least recently used files over the cap"""
+    global _gtts_cache_disk_bytes
+    with _gtts_cache_lock:
+        if _gtts_cache_disk_bytes is None:
+            _gtts_cache_disk_bytes = sum(
+                f.stat().st_size for f in _GTTS_CACHE_DIR.glob("*.mp3")
+            )
+        else:
+            _gtts_cache_disk_bytes += size
+        if _gtts_cache_disk_bytes <= _GTTS_CACHE_MAX_BYTES:
+            return
+        stats = [(f.stat(), f) for f in _GTTS_CACHE_DIR.glob("*.mp3")]
+        entries = sorted((st.st_mtime, st.st_size, f) for st, f in stats)
+        # Trim to 90% of the cap so eviction does not run on every write
+        target = _GTTS_CACHE_MAX_BYTES * 9 // 10
+        total = sum(file_size for _, file_size, _ in entries)
+        for _, file_size, cache_file in entries:
+            if total <= target:
+                break
+            try:
+                cache_file.unlink()
+                total -= file_size
+            except OSError:
+                pass
+        _gtts_cache_disk_bytes = total
+
+
+def _synthesize_gtts(text, language, slow):
+    """
+    Fetch gTTS audio for text as an in-memory MP3.
+    Results are cached in memory and on disk by (text, language, slow), since
+    flashcard sessions request the same words over and over.
+    """
+    global _gtts_cache_bytes
+    key = (text, language, slow)
+    with _gtts_cache_lock:
+        audio_data = _gtts_cache.get(key)
+        if audio_data is not None:
+            _gtts_cache.move_to_end(key)
+    if audio_data is None:
+        digest = hashlib.sha1(repr(key).encode("utf-8")).hexdigest()
+        cache_file = _GTTS_CACHE_DIR / f"{digest}.mp3"
+        try:
+            audio_data = cache_file.read_bytes()
+            # Mark as recently used (atime is unreliable with relatime mounts)
+            os.utime(cache_file)
+        except OSError:
+            tts = gTTS(text=text, lang=language, slow=slow)
+            mp3_fp = io.BytesIO()
+            tts.write_to_fp(mp3_fp)
+            audio_data = mp3_fp.getvalue()
+            try:
+                _GTTS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                # Write then rename so a half-written file is never read back
+                partial_file = cache_file.with_suffix(".part")
+                partial_file.write_bytes(audio_data)
+                os.replace(partial_file, cache_file)
+                _account_gtts_cache_write(len(audio_data))
+            except OSError as e:
+                print(f"gTTS cache write failed: {e}")
+        with _gtts_cache_lock:
+            previous = _gtts_cache.pop(key, None)
+            if previous is not None:
+                _gtts_cache_bytes -= len(previous)
+            _gtts_cache[key] = audio_data
+            _gtts_cache_bytes += len(audio_data)
+            # Older entries are still on disk, so dropping them costs a file read
+            while _gtts_cache_bytes > _GTTS_MEMORY_CACHE_MAX_BYTES and len(_gtts_cache) > 1:
+                _, evicted = _gtts_cache.popitem(last=False)
+                _gtts_cache_bytes -= len(evicted)
+    return io.BytesIO(audio_data)
+
+
+def prefetch_gtts(texts, language, slow=False):
+    """Synthesize and cache gTTS audio for texts ahead of playback"""
+    for text in texts:
+        if not text.strip():
+            continue
+        try:
+            _synthesize_gtts(text, language, slow)
+        except Exception as e:
+            print(f"gTTS prefetch failed for {text!r}: {e}")
+            return
+
+
+def _wait_for_playback():
+    """
+    Block until pygame music playback ends (or is stopped).
+    pygame only signals the end of music through the display event queue,
+    which this worker thread cannot wait on, so it checks at a fine
+    interval; pygame.time.wait releases the GIL while sleeping.
+    """
+    while pygame.mixer.music.get_busy():
+        pygame.time.wait(_PLAYBACK_POLL_MS)
+
+
 class gTTSEngine(TTSBase):
     """Google Text-to-Speech engine implementation"""
 
@@ -32,17 +156,13 @@ class gTTSEngine(TTSBase):
     def speak(self, text, language, slow=False, voice=None):
         """Speak text using gTTS (voice parameter ignored)"""
         try:
-            tts = gTTS(text=text, lang=language, slow=slow)
-            mp3_fp = io.BytesIO()
-            tts.write_to_fp(mp3_fp)
-            mp3_fp.seek(0)
+            mp3_fp = _synthesize_gtts(text, language, slow)
 
             pygame.mixer.music.load(mp3_fp)
             pygame.mixer.music.play()
 
             # Wait for playback to finish
-            while pygame.mixer.music.get_busy():
-                time.sleep(0.1)
+            _wait_for_playback()
 
             return True
         except Exception as e:
@@ -52,25 +172,29 @@ class gTTSEngine(TTSBase):
     def speak_words_sequentially(self, words, language, pause_between=0.5, voice=None):
         """Speak words one at a time with pauses (voice parameter ignored)"""
         try:
-            for i, word in enumerate(words):
-                if not word.strip():
-                    continue
-
-                tts = gTTS(text=word, lang=language, slow=True)
-                mp3_fp = io.BytesIO()
-                tts.write_to_fp(mp3_fp)
-                mp3_fp.seek(0)
-
-                pygame.mixer.music.load(mp3_fp)
-                pygame.mixer.music.play()
-
-                # Wait for playback to finish
-                while pygame.mixer.music.get_busy():
-                    time.sleep(0.1)
-
-                # Add pause between words
-                if i < len(words) - 1:
-                    time.sleep(pause_between)
+            words = [word for word in words if word.strip()]
+            # Download the next word while the current one plays, so the
+            # network round-trip overlaps playback instead of adding to it
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                pending = None
+                if words:
+                    pending = executor.submit(_synthesize_gtts, words[0], language, True)
+                for i in range(len(words)):
+                    mp3_fp = pending.result()
+                    if i < len(words) - 1:
+                        pending = executor.submit(
+                            _synthesize_gtts, words[i + 1], language, True
+                        )
+
+                    pygame.mixer.music.load(mp3_fp)
+                    pygame.mixer.music.play()
+
+                    # Wait for playback to finish
+                    _wait_for_playback()
+
+                    # Add pause between words
+                    if i < len(words) - 1:
+                        time.sleep(pause_between)
 
             return True
         except Exception as e:
@@ -95,7 +219,7 @@ class EdgeTTSEngine(TTSBase):
     def speak(self, text, language=None, slow=False, voice=None):
         """Speak text using Edge TTS (sync wrapper)"""
         try:
-            import asyncio, io, time
+            import asyncio, io
 
             voice_to_use = voice or self.voice
 
@@ -120,8 +244,7 @@ class EdgeTTSEngine(TTSBase):
             pygame.mixer.music.load(mp3_fp)
             pygame.mixer.music.play()
 
-            while pygame.mixer.music.get_busy():
-                time.sleep(0.1)
+            _wait_for_playback()
             return True
         except Exception as e:
             print(f"Edge TTS Error: {e}")
@@ -25,6 +25,8 @@ def main():
 
     window = ASRApp()
     window.show()
+    # Avoid the model-load delay on the first recognition
+    window.prewarm_asr_model()
 
     sys.exit(app.exec_())
 
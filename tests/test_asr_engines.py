@@ -0,0 +1,38 @@
+"""
+Tests for pronunciation analysis in core.asr_engines
+"""
+
+import pytest
+
+pytest.importorskip("numpy")
+pytest.importorskip("rapidfuzz")
+pytest.importorskip("PyQt5.QtCore")
+
+from core.asr_engines import ASRThread
+
+
+def _analyze(reference, recognized):
+    thread = ASRThread(None, {}, show_punctuation=False, show_word_time=False)
+    return thread.analyze_pronunciation(reference, recognized)
+
+
+@pytest.mark.parametrize(
+    "reference, recognized, word",
+    [("hello world", "hallo world", "hallo"), ("abcde", "abcdf", "abcdf")],
+)
+def test_word_similarity_of_exactly_80_percent_is_incorrect(
+    reference, recognized, word
+):
+    analysis = _analyze(reference, recognized)["word_analysis"]
+    entry = next(w for w in analysis if w["recognized"] == word)
+
+    assert entry["similarity"] == 80.0
+    assert entry["status"] == "incorrect"
+
+
+def test_matching_words_are_correct():
+    analysis = _analyze("hello world", "hallo world")["word_analysis"]
+    entry = next(w for w in analysis if w["recognized"] == "world")
+
+    assert entry["similarity"] == 100.0
+    assert entry["status"] == "correct"
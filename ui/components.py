@@ -2,19 +2,49 @@
 Custom UI components and widgets for ASR Application
 """
 
+import time
+from collections import deque
+from functools import lru_cache
+
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QTextEdit, QProgressBar, QFrame, QScrollArea, QSizePolicy
+    QTextEdit, QPlainTextEdit, QProgressBar, QFrame, QScrollArea, QSizePolicy, QStyle
 )
-from PyQt5.QtCore import Qt, pyqtSignal, QTimer
+from PyQt5.QtCore import Qt, pyqtSignal, QRect, QTimer
 from PyQt5.QtGui import QFont, QPixmap, QPainter, QColor
 
 
+@lru_cache(maxsize=None)
+def _cached_font(family, size, weight=-1):
+    """
+    Return a shared QFont, built on first request (i.e. once a QApplication
+    exists) so later widgets skip the font-database lookup
+    """
+    return QFont(family, size, weight)
+
+
+# Word analysis status markers
+_STATUS_ICONS = {
+    'correct': '✓',
+    'incorrect': '✗',
+    'missing': '✗',
+    'extra': '⚠'
+}
+
+
 class PronunciationFeedbackWidget(QWidget):
     """Widget displaying pronunciation feedback with visual indicators"""
 
+    _SS_GREEN = "color: green;"
+    _SS_ORANGE = "color: orange;"
+    _SS_RED = "color: red;"
+
     def __init__(self, parent=None):
         super().__init__(parent)
+        # Stylesheet currently applied to accuracy_label
+        self._last_ss = None
+        # (accuracy, threshold, word_analysis) most recently displayed
+        self._last_feedback = None
         self.init_ui()
 
     def init_ui(self):
@@ -23,7 +53,7 @@ class PronunciationFeedbackWidget(QWidget):
         # Accuracy display
         accuracy_layout = QHBoxLayout()
         self.accuracy_label = QLabel("Accuracy: N/A")
-        self.accuracy_label.setFont(QFont("Arial", 16, QFont.Bold))
+        self.accuracy_label.setFont(_cached_font("Arial", 16, QFont.Bold))
         accuracy_layout.addWidget(self.accuracy_label)
 
         self.accuracy_bar = QProgressBar()
@@ -41,6 +71,7 @@ class PronunciationFeedbackWidget(QWidget):
         # Word analysis area
         self.word_analysis = QTextEdit()
         self.word_analysis.setReadOnly(True)
+        self.word_analysis.setAcceptRichText(False)
         self.word_analysis.setMaximumHeight(200)
         layout.addWidget(self.word_analysis)
 
@@ -48,21 +79,35 @@ class PronunciationFeedbackWidget(QWidget):
 
     def update_feedback(self, accuracy, threshold=80, word_analysis=None):
         """Update the feedback display"""
+        # Skip every Qt call when the same result is shown again; the
+        # analysis list is kept referenced, so comparing by identity is safe
+        last = self._last_feedback
+        if (
+            last is not None
+            and last[:2] == (round(accuracy, 1), threshold)
+            and last[2] is word_analysis
+        ):
+            return
+        self._last_feedback = (round(accuracy, 1), threshold, word_analysis)
+
         self.accuracy_label.setText(f"Accuracy: {accuracy:.1f}%")
         self.accuracy_bar.setValue(int(accuracy))
 
         # Color coding
         if accuracy >= threshold:
-            color = "green"
+            ss = self._SS_GREEN
             status = "Excellent!"
         elif accuracy >= threshold - 10:
-            color = "orange"
+            ss = self._SS_ORANGE
             status = "Good"
         else:
-            color = "red"
+            ss = self._SS_RED
             status = "Needs Improvement"
 
-        self.accuracy_label.setStyleSheet(f"color: {color};")
+        # setStyleSheet re-polishes the label, so only call it on a change
+        if ss != self._last_ss:
+            self.accuracy_label.setStyleSheet(ss)
+            self._last_ss = ss
         self.status_label.setText(status)
 
         # Update word analysis
@@ -71,18 +116,19 @@ class PronunciationFeedbackWidget(QWidget):
 
     def display_word_analysis(self, word_analysis):
         """Display word-by-word analysis"""
-        text = "Word Analysis:\n"
-        for i, word in enumerate(word_analysis, 1):
-            status_icon = {
-                'correct': '✓',
-                'incorrect': '✗',
-                'missing': '✗',
-                'extra': '⚠'
-            }.get(word['status'], '?')
+        lines = [
+            f"{i}. {_STATUS_ICONS.get(word['status'], '?')} '{word['reference']}' → "
+            f"'{word['recognized']}' ({word['similarity']:.1f}%)\n"
+            for i, word in enumerate(word_analysis, 1)
+        ]
+        self.word_analysis.setPlainText("Word Analysis:\n" + "".join(lines))
 
-            text += f"{i}. {status_icon} '{word['reference']}' → '{word['recognized']}' ({word['similarity']:.1f}%)\n"
 
-        self.word_analysis.setText(text)
+# Audio level meter colors, created once rather than on every repaint
+_METER_BACKGROUND = QColor(200, 200, 200)
+_METER_GREEN = QColor(100, 200, 100)
+_METER_YELLOW = QColor(255, 200, 0)
+_METER_RED = QColor(255, 100, 100)
 
 
 class AudioLevelIndicator(QWidget):
@@ -96,37 +142,63 @@ class AudioLevelIndicator(QWidget):
 
     def set_level(self, level):
         """Set the audio level (0-100)"""
-        self.level = min(100, max(0, level))
-        self.update()
+        # Whole percent is the finest step the bar can show; skip the
+        # repaint when the level has not visibly changed
+        new_level = min(100, max(0, int(level)))
+        if new_level == self.level:
+            return
+        old_level, self.level = self.level, new_level
+
+        if self._level_color(old_level) is not self._level_color(new_level):
+            # The whole bar changes color
+            self.update()
+            return
+        # Only the strip between the old and new bar ends needs repainting
+        old_w = int(self.width() * (old_level / 100))
+        new_w = int(self.width() * (new_level / 100))
+        self.update(QRect(min(old_w, new_w), 0, abs(new_w - old_w) + 1, self.height()))
+
+    @staticmethod
+    def _level_color(level):
+        """Bar color for a level"""
+        if level < 30:
+            return _METER_GREEN
+        elif level < 70:
+            return _METER_YELLOW
+        return _METER_RED
 
     def paintEvent(self, event):
         painter = QPainter(self)
-        width = self.width()
-        height = self.height()
+        # Only the damaged region is repainted
+        dirty = event.rect()
 
         # Draw background
-        painter.fillRect(0, 0, width, height, QColor(200, 200, 200))
-
-        # Draw level bar
-        bar_width = int(width * (self.level / 100))
+        painter.fillRect(dirty, _METER_BACKGROUND)
 
-        # Color based on level
-        if self.level < 30:
-            color = QColor(100, 200, 100)  # Green
-        elif self.level < 70:
-            color = QColor(255, 200, 0)  # Yellow
-        else:
-            color = QColor(255, 100, 100)  # Red
-
-        painter.fillRect(0, 0, bar_width, height, color)
+        # Draw level bar, colored by level
+        bar_width = int(self.width() * (self.level / 100))
+        bar = QRect(0, 0, bar_width, self.height()).intersected(dirty)
+        if not bar.isEmpty():
+            painter.fillRect(bar, self._level_color(self.level))
 
 
 class ImageViewer(QWidget):
     """Image display widget with scaling"""
 
+    # Rapid resize events (e.g. dragging the window edge) are coalesced
+    # into one rescale after this delay
+    RESIZE_DEBOUNCE_MS = 20
+    # Once resizing has been idle this long, the image is rescaled smoothly
+    RESIZE_SETTLE_MS = 120
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.pixmap = None
+        # True while the widget is being resized interactively
+        self._resizing = False
+        # Last scaled result, keyed by (source pixmap, width, height, mode)
+        self._scaled_key = None
+        self._scaled_cache = None
         self.init_ui()
 
     def init_ui(self):
@@ -141,28 +213,60 @@ class ImageViewer(QWidget):
         layout.addWidget(self.label)
         self.setLayout(layout)
 
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(self.RESIZE_DEBOUNCE_MS)
+        self._resize_timer.timeout.connect(self._rescale)
+
+        self._settle_timer = QTimer(self)
+        self._settle_timer.setSingleShot(True)
+        self._settle_timer.setInterval(self.RESIZE_SETTLE_MS)
+        self._settle_timer.timeout.connect(self._finish_resize)
+
     def set_image(self, pixmap):
         """Set the displayed image"""
         if pixmap and not pixmap.isNull():
             self.pixmap = pixmap
-            # Scale to fit while maintaining aspect ratio
-            scaled = pixmap.scaled(
-                self.label.width() - 20,
-                self.label.height() - 20,
-                Qt.KeepAspectRatio,
-                Qt.SmoothTransformation
-            )
-            self.label.setPixmap(scaled)
+            # Snap to even sizes so 1-pixel resize jitter reuses the cached
+            # scale instead of triggering another one
+            target_w = (self.label.width() - 20) & ~1
+            target_h = (self.label.height() - 20) & ~1
+            # Cheap nearest-neighbour scaling while a resize is in progress;
+            # the smooth pass runs once the size settles
+            mode = Qt.FastTransformation if self._resizing else Qt.SmoothTransformation
+            key = (pixmap.cacheKey(), target_w, target_h, mode)
+            if key != self._scaled_key:
+                # Scale to fit while maintaining aspect ratio
+                self._scaled_cache = pixmap.scaled(
+                    target_w,
+                    target_h,
+                    Qt.KeepAspectRatio,
+                    mode
+                )
+                self._scaled_key = key
+            self.label.setPixmap(self._scaled_cache)
             self.label.setText("")
         else:
             self.label.setPixmap(QPixmap())
             self.label.setText("Invalid image")
 
+    def _rescale(self):
+        """Rescale the current image to the label's new size"""
+        if self.pixmap:
+            self.set_image(self.pixmap)
+
+    def _finish_resize(self):
+        """Redo the scale smoothly once interactive resizing has stopped"""
+        self._resizing = False
+        self._rescale()
+
     def resizeEvent(self, event):
         """Handle resize to rescale image"""
         super().resizeEvent(event)
         if self.pixmap:
-            self.set_image(self.pixmap)
+            self._resizing = True
+            self._resize_timer.start()
+            self._settle_timer.start()
 
 
 class StatusLog(QWidget):
@@ -170,43 +274,71 @@ class StatusLog(QWidget):
 
     message_logged = pyqtSignal(str)
 
+    # Messages are queued and written to the widget in batches this often
+    FLUSH_INTERVAL_MS = 80
+
     def __init__(self, parent=None, max_lines=100):
         super().__init__(parent)
         self.max_lines = max_lines
+        # Timestamped lines waiting for the next flush (oldest dropped first)
+        self._pending = deque(maxlen=max_lines)
         self.init_ui()
 
     def init_ui(self):
         layout = QVBoxLayout()
 
-        self.text_edit = QTextEdit()
+        self.text_edit = QPlainTextEdit()
         self.text_edit.setReadOnly(True)
+        # Qt drops the oldest lines itself once the limit is reached
+        self.text_edit.setMaximumBlockCount(self.max_lines)
         self.text_edit.setMaximumHeight(100)
-        font = QFont("Consolas", 9)
-        self.text_edit.setFont(font)
+        self.text_edit.setFont(_cached_font("Consolas", 9))
 
         layout.addWidget(self.text_edit)
         self.setLayout(layout)
 
-        self.message_logged.connect(self._append_message)
-
-    def _append_message(self, message):
-        """Internal method to append message"""
-        from datetime import datetime
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        self.text_edit.append(f"[{timestamp}] {message}")
-
-        # Limit lines
-        text = self.text_edit.toPlainText()
-        lines = text.split('\n')
-        if len(lines) > self.max_lines:
-            self.text_edit.setPlainText('\n'.join(lines[-self.max_lines:]))
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(self.FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self._flush)
+
+        # log() may be called from worker threads; the signal hands the
+        # timer start over to the GUI thread
+        self.message_logged.connect(self._schedule_flush)
+
+    def _schedule_flush(self, message):
+        """Start the batch timer unless a flush is already pending"""
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _flush(self):
+        """Write all pending messages to the log in one append"""
+        if not self._pending:
+            return
+        if not self.text_edit.isVisible():
+            # Nothing to repaint; showEvent flushes once the log is shown
+            return
+        lines = []
+        while self._pending:
+            lines.append(self._pending.popleft())
+        self.text_edit.appendPlainText('\n'.join(lines))
+
+    def showEvent(self, event):
+        """Write out messages buffered while the log was hidden"""
+        super().showEvent(event)
+        if self._pending:
+            self._flush_timer.start()
 
     def log(self, message):
         """Log a status message"""
+        t = time.localtime()
+        timestamp = f"{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}"
+        self._pending.append(f"[{timestamp}] {message}")
         self.message_logged.emit(message)
 
     def clear(self):
         """Clear the log"""
+        self._pending.clear()
         self.text_edit.clear()
 
 
@@ -258,7 +390,11 @@ class ExpandableGroup(QWidget):
 
         # Header
         header_layout = QHBoxLayout()
-        self.toggle_btn = QPushButton("▼")
+        # Arrow icons come from the style, rasterized once per group
+        self._icon_expanded = self.style().standardIcon(QStyle.SP_ArrowDown)
+        self._icon_collapsed = self.style().standardIcon(QStyle.SP_ArrowRight)
+        self.toggle_btn = QPushButton()
+        self.toggle_btn.setIcon(self._icon_expanded)
         self.toggle_btn.setFixedWidth(30)
         self.toggle_btn.clicked.connect(self.toggle)
 
@@ -282,7 +418,9 @@ class ExpandableGroup(QWidget):
         """Toggle expansion"""
         self.is_expanded = not self.is_expanded
         self.content.setVisible(self.is_expanded)
-        self.toggle_btn.setText("▼" if self.is_expanded else "▶")
+        self.toggle_btn.setIcon(
+            self._icon_expanded if self.is_expanded else self._icon_collapsed
+        )
 
     def add_widget(self, widget):
         """Add a widget to the content area"""
@@ -304,6 +442,8 @@ class VocabularyNavigator(QWidget):
         super().__init__(parent)
         self.total_items = total_items
         self.current_index = 0
+        # (current_index, total_items) last shown by update_state
+        self._last_state = (-1, -1)
         self.init_ui()
 
     def init_ui(self):
@@ -354,6 +494,10 @@ class VocabularyNavigator(QWidget):
 
     def update_state(self):
         """Update button states and counter"""
+        state = (self.current_index, self.total_items)
+        if state == self._last_state:
+            return
+        self._last_state = state
         self.prev_btn.setEnabled(self.current_index > 0)
         self.next_btn.setEnabled(self.current_index < self.total_items - 1)
         self.counter_label.setText(f"{self.current_index + 1} / {self.total_items}")
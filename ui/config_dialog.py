@@ -0,0 +1,801 @@
+"""
+Configuration dialog for ASR Application
+Contains ConfigDialog class for editing application settings
+"""
+
+import asyncio
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from types import MappingProxyType
+
+from PyQt5.QtWidgets import (
+    QApplication,
+    QDialog,
+    QVBoxLayout,
+    QHBoxLayout,
+    QLabel,
+    QComboBox,
+    QPushButton,
+    QGroupBox,
+    QSpinBox,
+    QGridLayout,
+    QPlainTextEdit,
+    QCheckBox,
+    QFileDialog,
+    QMessageBox,
+)
+from PyQt5.QtCore import (
+    Qt,
+    QObject,
+    QRunnable,
+    QSignalBlocker,
+    QThreadPool,
+    QTimer,
+    pyqtSignal,
+)
+
+from config import DEFAULT_CONFIG, to_mutable
+
+
+# Model choices offered for each ASR engine
+# Note: Free Google Speech API doesn't support model selection, so its only
+# entry is for reference - the API uses its default model
+_MODELS_GOOGLE = ("Default",)
+_MODELS_WHISPER = (
+    "tiny.en",
+    "tiny",
+    "base.en",
+    "base",
+    "small.en",
+    "small",
+    "medium.en",
+    "medium",
+    "large-v1",
+    "large-v2",
+    "large-v3",
+    "large",
+)
+_MODELS_QWEN = ("Qwen3-ASR-1.7B", "Qwen3-ASR-0.6B")
+_MODELS_BY_ENGINE = {
+    "Google Speech Recognition": _MODELS_GOOGLE,
+    "Whisper": _MODELS_WHISPER,
+    "Qwen3-ASR": _MODELS_QWEN,
+}
+
+# Model preselected when switching to an engine (others keep the first entry)
+_DEFAULT_MODEL = {
+    "Qwen3-ASR": DEFAULT_CONFIG["asr_engine_settings"]["Qwen3-ASR"]["model"],
+}
+
+# Supported recognition languages: display name -> locale code
+_LANGUAGES = MappingProxyType(
+    {
+        "Greek": "el-GR",
+        "English (US)": "en-US",
+        "English (UK)": "en-GB",
+        "Spanish": "es-ES",
+        "French": "fr-FR",
+        "German": "de-DE",
+        "Italian": "it-IT",
+        "Portuguese": "pt-PT",
+        "Russian": "ru-RU",
+        "Chinese": "zh-CN",
+        "Japanese": "ja-JP",
+        "Korean": "ko-KR",
+        "Arabic": "ar-SA",
+    }
+)
+
+_LANGUAGE_NAMES = tuple(_LANGUAGES)
+_LANGUAGE_BY_CODE = MappingProxyType({code: name for name, code in _LANGUAGES.items()})
+
+# Vocabulary file delimiters offered in the dialog
+_DELIMITERS = ("|", ",", ";", "\t")
+
+# Vocabulary column mapping rows: (label, vocab_columns key)
+_COL_SPECS = (
+    ("Reference Text", "reference"),
+    ("Definition", "definition"),
+    ("English Pronunciation", "english_pronunciation"),
+    ("IPA Pronunciation", "ipa_pronunciation"),
+    ("Image Description", "image_description"),
+    ("Image Filename", "image_filename"),
+    ("Grammar", "grammar"),
+    ("Mnemonics", "mnemonics"),
+)
+
+# 1 second, 1 kHz tone used by the ASR connection test (generated on first use)
+_TEST_TONE_PATH = os.path.join(tempfile.gettempdir(), "asr_test_tone.wav")
+
+
+def _get_test_tone_path():
+    """Return the path of the connection-test tone, writing it if missing"""
+    if not os.path.exists(_TEST_TONE_PATH):
+        import numpy as np
+        import soundfile as sf
+
+        sample_rate = 16000
+        frequency = 1000
+        t = np.arange(sample_rate, dtype=np.float32) / sample_rate
+        data = (np.sin(2 * np.pi * frequency * t) * 32767).astype(np.int16)
+
+        # Write to a scratch file first so a partial write is never reused
+        partial_path = _TEST_TONE_PATH + ".part"
+        sf.write(partial_path, data, sample_rate, format="WAV")
+        os.replace(partial_path, _TEST_TONE_PATH)
+    return _TEST_TONE_PATH
+
+
+def _prewarm_test_imports():
+    """Import the connection-test dependencies so the first Test click is fast"""
+    for module in ("numpy", "soundfile", "core.asr_engines"):
+        try:
+            __import__(module)
+        except Exception:
+            # Missing optional packages are reported when the test runs
+            pass
+
+
+class _VoiceBridge(QObject):
+    """Signal bridge so the voice fetch worker can post results to the GUI thread"""
+
+    # Signal carries the list of (display, shortname) tuples
+    voices_ready = pyqtSignal(list)
+
+
+class _VoiceFetchRunnable(QRunnable):
+    """Pooled worker that fetches the edge-tts voice list off the GUI thread"""
+
+    def __init__(self, bridge):
+        super().__init__()
+        self.bridge = bridge
+
+    def run(self):
+        print("[DEBUG] voice fetch worker started")
+        voices_data = []
+        try:
+            import edge_tts
+
+            print("[DEBUG] edge_tts imported successfully")
+            # asyncio.run() creates a brand-new event loop — safe in a pool thread
+            voices = asyncio.run(edge_tts.list_voices())
+            print(
+                f"[DEBUG] asyncio.run(list_voices()) returned {len(voices)} voices"
+            )
+
+            if not voices:
+                print("[DEBUG] WARNING: voice list is empty!")
+
+            # Sort and format
+            voices.sort(key=lambda v: (v.get("Locale", ""), v.get("ShortName", "")))
+            for voice in voices:
+                display = (
+                    f"{voice.get('ShortName', 'Unknown')} "
+                    f"({voice.get('Locale', 'Unknown')}) - "
+                    f"{voice.get('Gender', 'Unknown')}"
+                )
+                voices_data.append((display, voice.get("ShortName")))
+
+            print(f"[DEBUG] Prepared {len(voices_data)} voice entries for UI")
+
+        except ImportError as e:
+            print(f"[DEBUG] ImportError — edge_tts not installed? {e}")
+            voices_data = [(f"edge-tts not installed: {e}", None)]
+        except Exception as e:
+            print(f"[DEBUG] Exception fetching voices: {type(e).__name__}: {e}")
+            import traceback
+
+            traceback.print_exc()
+            voices_data = [(f"Error loading voices: {e}", None)]
+
+        # Widgets can only be touched from the main thread, so hand the
+        # result to the signal bridge; Qt delivers it via a queued connection.
+        print("[DEBUG] Dispatching voices to main thread via _VoiceBridge")
+        self.bridge.voices_ready.emit(voices_data)
+
+
+class ConfigDialog(QDialog):
+    """Configuration dialog for ASR Application settings"""
+
+    def __init__(self, parent=None, current_config=None):
+        super().__init__(parent)
+        self.current_config = (
+            current_config if current_config is not None else DEFAULT_CONFIG
+        )
+        self.setWindowTitle("Configuration")
+        self.setModal(True)
+        self.setMinimumWidth(500)
+        # Preset management
+        self.presets_dir = Path(__file__).parent.parent / "Data"
+        self.pending_tts_voice = None
+        # Settings (engine, model, device, language) that passed a connection test
+        self._test_cache = set()
+        self._test_key = None
+        # Widgets are built on first show (or first programmatic access)
+        self._ui_built = False
+
+    def showEvent(self, event):
+        """Build the widgets the first time the dialog is shown"""
+        if not self._ui_built:
+            self._ensure_ui()
+            self.adjustSize()
+            QTimer.singleShot(0, self._prewarm_imports)
+        super().showEvent(event)
+
+    def _prewarm_imports(self):
+        """Load the connection-test modules in the background once shown"""
+        threading.Thread(target=_prewarm_test_imports, daemon=True).start()
+
+    def _ensure_ui(self):
+        """Create the dialog widgets if they have not been built yet"""
+        if not self._ui_built:
+            self._ui_built = True
+            self.init_ui()
+
+    def init_ui(self):
+        layout = QVBoxLayout()
+
+        # Engine selection
+        engine_group = QGroupBox("ASR Engine")
+        engine_layout = QVBoxLayout()
+
+        self.engine_label = QLabel("Select Engine:")
+        self.engine_combo = QComboBox()
+        self.engine_combo.addItems(DEFAULT_CONFIG["asr_engines"])
+        self.engine_combo.currentIndexChanged.connect(self.on_engine_changed)
+
+        engine_layout.addWidget(self.engine_label)
+        engine_layout.addWidget(self.engine_combo)
+        engine_group.setLayout(engine_layout)
+        layout.addWidget(engine_group)
+
+        # Language selection
+        lang_group = QGroupBox("Language")
+        lang_layout = QVBoxLayout()
+
+        self.lang_label = QLabel("Select Language:")
+        self.lang_combo = QComboBox()
+        self.languages = _LANGUAGES
+        self.lang_combo.addItems(_LANGUAGE_NAMES)
+        self.lang_combo.setCurrentText("Greek")
+
+        lang_layout.addWidget(self.lang_label)
+        lang_layout.addWidget(self.lang_combo)
+        lang_group.setLayout(lang_layout)
+        layout.addWidget(lang_group)
+
+        # Model selection
+        model_group = QGroupBox("Model")
+        model_layout = QVBoxLayout()
+
+        self.model_label = QLabel("Select Model:")
+        self.model_combo = QComboBox()
+        self.update_model_options()
+
+        model_layout.addWidget(self.model_label)
+        model_layout.addWidget(self.model_combo)
+        model_group.setLayout(model_layout)
+        layout.addWidget(model_group)
+
+        # Additional settings
+        settings_group = QGroupBox("Additional Settings")
+        settings_layout = QVBoxLayout()
+
+        # Sample rate
+        rate_layout = QHBoxLayout()
+        self.rate_label = QLabel("Sample Rate (Hz):")
+        self.rate_entry = QSpinBox()
+        self.rate_entry.setRange(8000, 96000)
+        self.rate_entry.setSingleStep(8000)
+        self.rate_entry.setValue(16000)
+        rate_layout.addWidget(self.rate_label)
+        rate_layout.addWidget(self.rate_entry)
+        settings_layout.addLayout(rate_layout)
+
+        # Energy threshold for Google
+        energy_layout = QHBoxLayout()
+        self.energy_label = QLabel("Energy Threshold:")
+        self.energy_entry = QSpinBox()
+        self.energy_entry.setRange(0, 10000)
+        self.energy_entry.setValue(300)
+        energy_layout.addWidget(self.energy_label)
+        energy_layout.addWidget(self.energy_entry)
+        settings_layout.addLayout(energy_layout)
+
+        # Device selection for Qwen3-ASR
+        device_layout = QHBoxLayout()
+        self.device_label = QLabel("Device:")
+        self.device_combo = QComboBox()
+        self.device_combo.addItems(["auto", "cpu", "cuda"])
+        self.device_combo.setToolTip("Select processing device (auto-detects GPU/CPU)")
+        device_layout.addWidget(self.device_label)
+        device_layout.addWidget(self.device_combo)
+        settings_layout.addLayout(device_layout)
+
+        # Test connection button
+        test_layout = QHBoxLayout()
+        self.test_btn = QPushButton("Test Connection")
+        self.test_btn.clicked.connect(self.test_asr_connection)
+        self.test_btn.setToolTip("Test ASR engine connection")
+        self.test_status = QLabel("")
+        self.test_status.setStyleSheet("color: gray;")
+        test_layout.addWidget(self.test_btn)
+        test_layout.addWidget(self.test_status)
+        settings_layout.addLayout(test_layout)
+
+        # Test result feedback
+        self.test_feedback = QLabel("")
+        self.test_feedback.setWordWrap(True)
+        self.test_feedback.setStyleSheet("color: gray;")
+        settings_layout.addWidget(self.test_feedback)
+
+        # New: Status text box for detailed info
+        self.status_log = QPlainTextEdit()
+        self.status_log.setReadOnly(True)
+        self.status_log.setMaximumBlockCount(200)  # Bound memory across test runs
+        self.status_log.setFixedHeight(100)  # Give it a fixed height
+        self.status_log.setPlaceholderText(
+            "Connection test status and model info will appear here..."
+        )
+        settings_layout.addWidget(self.status_log)
+
+        # Pronunciation threshold
+        pron_layout = QHBoxLayout()
+        self.pron_label = QLabel("Pronunciation Accuracy Threshold (%):")
+        self.pron_spin = QSpinBox()
+        self.pron_spin.setRange(50, 100)
+        self.pron_spin.setValue(80)
+        pron_layout.addWidget(self.pron_label)
+        pron_layout.addWidget(self.pron_spin)
+        settings_layout.addLayout(pron_layout)
+
+        settings_group.setLayout(settings_layout)
+        layout.addWidget(settings_group)
+
+        # TTS Engine selection
+        tts_group = QGroupBox("Text-to-Speech (TTS)")
+        tts_layout = QVBoxLayout()
+
+        self.tts_engine_label = QLabel("Select TTS Engine:")
+        self.tts_engine_combo = QComboBox()
+        self.tts_engine_combo.addItems(DEFAULT_CONFIG["tts_engines"])
+        self.tts_engine_combo.setToolTip("Select TTS engine for pronunciation playback")
+        # Initialize to the configured engine; the voice widgets don't exist
+        # yet, so on_tts_engine_changed() is run explicitly at the end of init_ui
+        current_engine = self.current_config.get(
+            "tts_engine", DEFAULT_CONFIG.get("tts_engine", "gTTS")
+        )
+        index = self.tts_engine_combo.findText(current_engine)
+        if index >= 0:
+            self.tts_engine_combo.setCurrentIndex(index)
+        self.tts_engine_combo.currentIndexChanged.connect(self.on_tts_engine_changed)
+
+        tts_layout.addWidget(self.tts_engine_label)
+        tts_layout.addWidget(self.tts_engine_combo)
+
+        # Voice selection (for edge-tts)
+        self.voice_label = QLabel("Voice (edge-tts only):")
+        self.voice_combo = QComboBox()
+        self.voice_combo.setEnabled(False)
+        self.voice_combo.setToolTip(
+            "Select voice for edge-tts (only applicable when edge-tts engine is selected)"
+        )
+
+        tts_layout.addWidget(self.voice_label)
+        tts_layout.addWidget(self.voice_combo)
+
+        # Normalize polytonic Greek checkbox
+        self.normalize_tts_cb = QCheckBox("Normalize polytonic Greek text for edge-tts")
+        self.normalize_tts_cb.setToolTip(
+            "When enabled, polytonic Greek (Ancient/Church) will be normalized to monotonic "
+            "for better TTS pronunciation. Only applies to edge-tts engine when using Greek "
+            "language (el) or a Multilingual voice."
+        )
+        self.normalize_tts_cb.setChecked(self.current_config.get("normalize_tts", True))
+        tts_layout.addWidget(self.normalize_tts_cb)
+
+        # Info label about voice selection
+        self.tts_info_label = QLabel(
+            "Note: gTTS uses language setting only. edge-tts offers specific voices."
+        )
+        self.tts_info_label.setStyleSheet("color: gray; font-size: 10px;")
+        tts_layout.addWidget(self.tts_info_label)
+
+        tts_group.setLayout(tts_layout)
+        layout.addWidget(tts_group)
+
+        # Vocabulary File Configuration
+        vocab_config_group = QGroupBox("Vocabulary File Settings")
+        vocab_config_layout = QVBoxLayout()
+
+        # Delimiter selection
+        delim_layout = QHBoxLayout()
+        self.delim_label = QLabel("Delimiter:")
+        self.delim_combo = QComboBox()
+        self.delimiters = _DELIMITERS
+        self.delim_combo.addItems(self.delimiters)
+        self.delim_combo.setCurrentText("|")
+        delim_layout.addWidget(self.delim_label)
+        delim_layout.addWidget(self.delim_combo)
+        vocab_config_layout.addLayout(delim_layout)
+
+        # Column mappings
+        col_mapping_layout = QGridLayout()
+
+        self.col_spins = {}
+        for row, (label, key) in enumerate(_COL_SPECS):
+            spin = QSpinBox()
+            spin.setRange(1, 20)
+            spin.setValue(DEFAULT_CONFIG["vocab_columns"][key])
+            col_mapping_layout.addWidget(QLabel(f"{label} Column:"), row, 0)
+            col_mapping_layout.addWidget(spin, row, 1)
+            self.col_spins[key] = spin
+
+        vocab_config_layout.addLayout(col_mapping_layout)
+        vocab_config_group.setLayout(vocab_config_layout)
+        layout.addWidget(vocab_config_group)
+
+        # Presets management
+        presets_group = QGroupBox("Presets")
+        presets_layout = QHBoxLayout()
+        self.save_preset_btn = QPushButton("Save Configuration...")
+        self.load_preset_btn = QPushButton("Load Configuration...")
+        self.restore_defaults_btn = QPushButton("Restore Defaults")
+        self.save_preset_btn.clicked.connect(self.save_configuration)
+        self.load_preset_btn.clicked.connect(self.load_configuration)
+        self.restore_defaults_btn.clicked.connect(self.restore_defaults)
+        presets_layout.addWidget(self.save_preset_btn)
+        presets_layout.addWidget(self.load_preset_btn)
+        presets_layout.addWidget(self.restore_defaults_btn)
+        presets_group.setLayout(presets_layout)
+        layout.addWidget(presets_group)
+
+        # Buttons
+        btn_layout = QHBoxLayout()
+        self.ok_btn = QPushButton("OK")
+        self.cancel_btn = QPushButton("Cancel")
+        self.ok_btn.clicked.connect(self.accept)
+        self.cancel_btn.clicked.connect(self.reject)
+        btn_layout.addWidget(self.ok_btn)
+        btn_layout.addWidget(self.cancel_btn)
+        layout.addLayout(btn_layout)
+
+        self.setLayout(layout)
+        self.on_tts_engine_changed()
+
+    def on_engine_changed(self):
+        engine = self.engine_combo.currentText()
+        self.update_model_options(engine)
+        self.update_device_visibility(engine)
+
+    def update_device_visibility(self, engine=None):
+        """Show/hide device selection based on engine"""
+        if engine is None:
+            engine = self.engine_combo.currentText()
+        if engine == "Qwen3-ASR":
+            self.device_label.show()
+            self.device_combo.show()
+            self.device_combo.setCurrentText("auto")
+        else:
+            self.device_label.hide()
+            self.device_combo.hide()
+
+    def update_model_options(self, engine=None):
+        if engine is None:
+            engine = self.engine_combo.currentText()
+        # Repopulate silently so clear/add/select don't each emit
+        # currentIndexChanged for intermediate states
+        with QSignalBlocker(self.model_combo):
+            self.model_combo.clear()
+            self.model_combo.addItems(_MODELS_BY_ENGINE.get(engine, ()))
+            default_model = _DEFAULT_MODEL.get(engine)
+            if default_model:
+                self.model_combo.setCurrentText(default_model)
+
+    def on_tts_engine_changed(self):
+        """Handle TTS engine selection change"""
+        engine = self.tts_engine_combo.currentText()
+        print(
+            f"[DEBUG] on_tts_engine_changed: engine={engine}, voice_combo.count={self.voice_combo.count()}"
+        )
+        if engine == "edge-tts":
+            self.voice_label.show()
+            self.voice_combo.show()
+            self.voice_combo.setEnabled(True)
+            if self.voice_combo.count() == 0:
+                print("[DEBUG] Calling load_edge_tts_voices")
+                self.load_edge_tts_voices()
+            else:
+                print("[DEBUG] Voice combo already has items, skipping load")
+        else:
+            self.voice_label.hide()
+            self.voice_combo.hide()
+            self.voice_combo.setEnabled(False)
+
+    def load_edge_tts_voices(self):
+        """Load available edge-tts voices in background thread"""
+        # Show loading state immediately (called from main thread — safe)
+        self.voice_combo.clear()
+        self.voice_combo.addItem("Loading voices...", None)
+        self.voice_combo.setEnabled(False)
+        print("[DEBUG] load_edge_tts_voices: starting background fetch thread")
+
+        # Create the signal bridge once so the worker thread can safely post
+        # the result back to the main thread.  Qt automatically makes this a
+        # QueuedConnection because the signal is emitted from a different
+        # thread — so _on_voices_ready always runs on the main thread.
+        if not hasattr(self, "_voice_bridge"):
+            self._voice_bridge = _VoiceBridge(self)  # parent=self keeps it alive
+            self._voice_bridge.voices_ready.connect(self._on_voices_ready)
+
+        QThreadPool.globalInstance().start(_VoiceFetchRunnable(self._voice_bridge))
+        print("[DEBUG] Voice fetch queued on thread pool, returning control to event loop")
+
+    def _on_voices_ready(self, voices_data):
+        """Populate the voice combo with fetched voices (runs on the main thread)"""
+        print("[DEBUG] _on_voices_ready signal received on main thread")
+        self.voice_combo.clear()
+        for display, data in voices_data:
+            self.voice_combo.addItem(display, data)
+        print(f"[DEBUG] voice_combo now has {self.voice_combo.count()} items")
+
+        # Determine voice to select: pending from set_config or current config
+        desired_voice = self.pending_tts_voice
+        if desired_voice is None:
+            desired_voice = self.current_config.get(
+                "tts_voice", DEFAULT_CONFIG["tts_voice"]
+            )
+        print(
+            f"[DEBUG] Looking for voice: '{desired_voice}' (pending: {self.pending_tts_voice})"
+        )
+        idx = self.voice_combo.findData(desired_voice)
+        if idx >= 0:
+            self.voice_combo.setCurrentIndex(idx)
+            print(f"[DEBUG] Voice set at index {idx}")
+        else:
+            print(f"[DEBUG] Voice '{desired_voice}' not found — selecting index 0")
+            if self.voice_combo.count() > 0:
+                self.voice_combo.setCurrentIndex(0)
+        # Clear pending after use
+        self.pending_tts_voice = None
+
+        # Enable the combo only when we have real entries
+        has_valid = len(voices_data) > 0 and voices_data[0][1] is not None
+        self.voice_combo.setEnabled(has_valid)
+        print(f"[DEBUG] voice_combo enabled={has_valid}")
+
+    def test_asr_connection(self):
+        """Test ASR engine connection and display feedback"""
+        from core.asr_engines import ASRThread
+
+        engine = self.engine_combo.currentText()
+        device = self.device_combo.currentText()
+        model = self.model_combo.currentText()  # Get selected model
+        language = _LANGUAGES[self.lang_combo.currentText()]
+
+        # Skip reloading the model for settings that already passed;
+        # Shift+click forces a fresh test
+        self._test_key = (engine, model, device, language)
+        forced = QApplication.keyboardModifiers() & Qt.ShiftModifier
+        if self._test_key in self._test_cache and not forced:
+            self.test_status.setText("✅ Connected (cached)")
+            self.test_status.setStyleSheet("color: green;")
+            self.status_log.appendPlainText(
+                f"Using cached result for {engine} ({model}); Shift+click to retest"
+            )
+            return
+
+        self.test_btn.setEnabled(False)
+        self.test_status.setText("⏳ Testing...")
+        self.status_log.clear()  # Clear previous logs
+        self.status_log.appendPlainText(f"Attempting to test ASR engine: {engine}")
+        self.status_log.appendPlainText(f"Selected model: {model}")
+        if engine == "Qwen3-ASR":
+            self.status_log.appendPlainText(f"Selected device: {device}")
+
+        try:
+            # The test tone is constant, so it is generated once and reused
+            test_audio_file = _get_test_tone_path()
+        except Exception as e:
+            self._on_test_error(str(e))
+            return
+        self.status_log.appendPlainText(f"Using test audio file: {test_audio_file}")
+
+        # Create test config
+        test_config = {
+            "engine": engine,
+            "device": device,
+            "sample_rate": 16000,
+            "model": model,  # Use the selected model
+            "language": language,
+            "energy_threshold": 300,
+        }
+        self.status_log.appendPlainText(f"Test configuration: {test_config}")
+
+        self.status_log.appendPlainText("Starting ASR thread for connection test...")
+        # Run the test in the background; the result arrives via signals so
+        # the dialog stays responsive while the model loads
+        self._test_thread = ASRThread(
+            test_audio_file,
+            test_config,
+            show_punctuation=False,
+            show_word_time=False,
+        )
+        self._test_thread.finished.connect(self._on_test_finished)
+        self._test_thread.error.connect(self._on_test_error)
+        self._test_thread.start()
+
+    def _on_test_finished(self, text, metadata):
+        """Handle a successful ASR connection test"""
+        self._test_cache.add(self._test_key)
+        self.test_status.setText("✅ Connected")
+        self.test_status.setStyleSheet("color: green;")
+        self.test_feedback.setText("✅ ASR engine connection successful!")
+        self.status_log.appendPlainText("✅ Connection test completed successfully!")
+        self._finish_test()
+
+    def _on_test_error(self, error_msg):
+        """Handle a failed ASR connection test"""
+        self.test_status.setText("❌ Failed")
+        self.test_status.setStyleSheet("color: red;")
+        self.test_feedback.setText(f"❌ Connection failed: {error_msg}")
+        self.status_log.appendPlainText(f"❌ Connection test failed: {error_msg}")
+        self._finish_test()
+
+    def _finish_test(self):
+        """Restore the test controls once a connection test has ended"""
+        self.test_btn.setEnabled(True)
+        self.test_feedback.show()
+
+    def set_config(self, config_dict):
+        """Populate the dialog controls from a configuration dictionary."""
+        self._ensure_ui()
+        # ASR Engine
+        self.engine_combo.setCurrentText(
+            config_dict.get("engine", DEFAULT_CONFIG["engine"])
+        )
+        # Language (by display name, falling back to the locale code)
+        lang_name = config_dict.get("language_name") or _LANGUAGE_BY_CODE.get(
+            config_dict.get("language"), DEFAULT_CONFIG["language_name"]
+        )
+        self.lang_combo.setCurrentText(lang_name)
+        # Model
+        self.model_combo.setCurrentText(
+            config_dict.get("model", DEFAULT_CONFIG["model"])
+        )
+        # Sample rate
+        self.rate_entry.setValue(
+            config_dict.get("sample_rate", DEFAULT_CONFIG["sample_rate"])
+        )
+        # Energy threshold
+        self.energy_entry.setValue(
+            config_dict.get("energy_threshold", DEFAULT_CONFIG["energy_threshold"])
+        )
+        # Pronunciation threshold
+        self.pron_spin.setValue(
+            config_dict.get(
+                "pronunciation_threshold", DEFAULT_CONFIG["pronunciation_threshold"]
+            )
+        )
+        # Vocabulary delimiter
+        self.delim_combo.setCurrentText(
+            config_dict.get("vocab_delimiter", DEFAULT_CONFIG["vocab_delimiter"])
+        )
+        # Column mappings
+        cols = config_dict.get("vocab_columns", DEFAULT_CONFIG["vocab_columns"])
+        for key, spin in self.col_spins.items():
+            spin.setValue(cols.get(key, DEFAULT_CONFIG["vocab_columns"][key]))
+        # TTS engine
+        self.tts_engine_combo.setCurrentText(
+            config_dict.get("tts_engine", DEFAULT_CONFIG["tts_engine"])
+        )
+        # TTS voice: set pending for edge-tts; apply immediately if voice list already loaded
+        self.pending_tts_voice = config_dict.get(
+            "tts_voice", DEFAULT_CONFIG["tts_voice"]
+        )
+        if (
+            self.tts_engine_combo.currentText() == "edge-tts"
+            and self.voice_combo.count() > 0
+        ):
+            idx = self.voice_combo.findData(self.pending_tts_voice)
+            if idx >= 0:
+                self.voice_combo.setCurrentIndex(idx)
+            self.pending_tts_voice = None
+        elif self.tts_engine_combo.currentText() != "edge-tts":
+            self.pending_tts_voice = None
+        # Normalize TTS polytonic Greek
+        self.normalize_tts_cb.setChecked(
+            config_dict.get("normalize_tts", DEFAULT_CONFIG["normalize_tts"])
+        )
+
+    def save_configuration(self):
+        """Save the current configuration to a JSON file in Data directory."""
+        config = self.get_config()
+        self.presets_dir.mkdir(parents=True, exist_ok=True)
+        default_name = "config_preset.json"
+        file_path, _ = QFileDialog.getSaveFileName(
+            self,
+            "Save Configuration",
+            str(self.presets_dir / default_name),
+            "JSON Files (*.json);;All Files (*)",
+        )
+        if not file_path:
+            return
+        try:
+            with open(file_path, "w", encoding="utf-8") as fp:
+                json.dump(config, fp, indent=4, ensure_ascii=False)
+            QMessageBox.information(
+                self, "Configuration Saved", f"Saved to:\n{file_path}"
+            )
+        except Exception as e:
+            QMessageBox.critical(
+                self, "Save Error", f"Failed to save configuration:\n{e}"
+            )
+
+    def load_configuration(self):
+        """Load configuration from a JSON file."""
+        self.presets_dir.mkdir(parents=True, exist_ok=True)
+        file_path, _ = QFileDialog.getOpenFileName(
+            self,
+            "Load Configuration",
+            str(self.presets_dir),
+            "JSON Files (*.json);;All Files (*)",
+        )
+        if not file_path:
+            return
+        try:
+            with open(file_path, "r", encoding="utf-8") as fp:
+                loaded = json.load(fp)
+            self.set_config(loaded)
+            QMessageBox.information(
+                self, "Configuration Loaded", f"Loaded from:\n{file_path}"
+            )
+        except Exception as e:
+            QMessageBox.critical(
+                self, "Load Error", f"Failed to load configuration:\n{e}"
+            )
+
+    def restore_defaults(self):
+        """Restore all settings to default values."""
+        reply = QMessageBox.question(
+            self,
+            "Restore Defaults",
+            "Are you sure you want to restore all settings to defaults?\nThis cannot be undone.",
+            QMessageBox.Yes | QMessageBox.No,
+            QMessageBox.No,
+        )
+        if reply == QMessageBox.Yes:
+            self.set_config(DEFAULT_CONFIG)
+            QMessageBox.information(
+                self, "Defaults Restored", "All settings have been reset to defaults."
+            )
+
+    def get_config(self):
+        """Get the current configuration as a dictionary"""
+        self._ensure_ui()
+        config = {
+            "engine": self.engine_combo.currentText(),
+            "language": _LANGUAGES[self.lang_combo.currentText()],
+            "language_name": self.lang_combo.currentText(),
+            "model": self.model_combo.currentText(),
+            "sample_rate": self.rate_entry.value(),
+            "energy_threshold": self.energy_entry.value(),
+            "pronunciation_threshold": self.pron_spin.value(),
+            "vocab_delimiter": self.delim_combo.currentText(),
+            "vocab_columns": {
+                key: spin.value() for key, spin in self.col_spins.items()
+            },
+            "tts_engine": self.tts_engine_combo.currentText(),
+            "tts_voice": self.voice_combo.currentData()
+            if self.voice_combo.currentData()
+            else DEFAULT_CONFIG["tts_voice"],
+            "normalize_tts": self.normalize_tts_cb.isChecked(),
+            # Include default settings for new features
+            "asr_engines": to_mutable(DEFAULT_CONFIG["asr_engines"]),
+            "tts_engines": to_mutable(DEFAULT_CONFIG["tts_engines"]),
+            "flashcard": to_mutable(DEFAULT_CONFIG["flashcard"]),
+        }
+        return config
@@ -3,11 +3,23 @@ Flashcard Mode module for ASR Application
 Provides spaced repetition learning with progress tracking
 """
 
+import heapq
+import itertools
 import json
 import os
-import random
-from datetime import datetime, timedelta
+import threading
+import time
+import zipfile
+from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
+
+import numpy as np
+
+try:
+    import orjson  # Optional: faster progress load/save for large decks
+except ImportError:
+    orjson = None
 from PyQt5.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -24,11 +36,13 @@ from PyQt5.QtWidgets import (
     QDialogButtonBox,
     QComboBox,
 )
-from PyQt5.QtCore import Qt, pyqtSignal, QTimer
-from PyQt5.QtGui import QFont, QPixmap
+from PyQt5.QtCore import Qt, pyqtSignal, QTimer, QRunnable, QThreadPool
+from PyQt5.QtGui import QFont, QImage, QPixmap, QPixmapCache
 
 # Import TTS engines
-from core.tts_engines import TTSThread
+from core.tts_engines import TTSThread, prefetch_gtts, tts_language_code
+
+from core import srs_fsrs
 
 # Import recording functionality
 from core.recorder import RecordThread
@@ -36,6 +50,174 @@ import sounddevice as sd
 import soundfile as sf
 
 
+# Pre-FSRS intervals in days, indexed by correct-answer streak; only used to
+# seed FSRS state for progress saved by older versions
+_REVIEW_INTERVALS = (1, 3, 7, 14, 30)
+
+_DEFAULT_LOGO_PATH = str(Path("Data") / "Logo.png")
+
+# Delay before rated progress is written to disk (restarted by each rating)
+_PROGRESS_SAVE_DELAY_MS = 2000
+
+# Number of upcoming cards whose image and audio are prepared in the background
+_PREFETCH_AHEAD = 3
+# Longest closeEvent waits for running prefetch tasks
+_PREFETCH_CLOSE_WAIT_MS = 200
+
+
+def _item_id(item):
+    """Progress key for a vocabulary item"""
+    return item.get("reference", str(item))
+
+
+# Open vocabulary ZIPs, kept for the dialog's lifetime so image reads do not
+# re-open the archive and re-parse its central directory
+_vocab_zips = {}  # zip path -> ZipFile
+_vocab_zips_lock = threading.Lock()
+
+
+def _open_vocab_zip(zip_path):
+    """
+    Return a shared ZipFile for zip_path, opening it on first use.
+    ZipFile serializes reads on a shared handle, so prefetch workers may
+    use it too.
+    """
+    with _vocab_zips_lock:
+        zip_file = _vocab_zips.get(zip_path)
+        if zip_file is None:
+            zip_file = _vocab_zips[zip_path] = zipfile.ZipFile(zip_path, "r")
+        return zip_file
+
+
+def _close_vocab_zips():
+    """Close the handles opened by _open_vocab_zip"""
+    with _vocab_zips_lock:
+        for zip_file in _vocab_zips.values():
+            zip_file.close()
+        _vocab_zips.clear()
+
+
+@lru_cache(maxsize=8)
+def _load_recording(path):
+    """
+    Decode a recording as float32 (data, samplerate). RecordThread writes
+    every take to a fresh temp file, so the path identifies the audio and
+    entries never need invalidating; old takes simply age out.
+    """
+    return sf.read(path, dtype="float32")
+
+
+@lru_cache(maxsize=4)
+def _zip_image_index(zip_path):
+    """Map file stems to member names for a vocabulary ZIP (first match wins)"""
+    index = {}
+    for name in _open_vocab_zip(zip_path).namelist():
+        index.setdefault(Path(name).stem, name)
+    return index
+
+
+# Only a hand-off from prefetch workers to the GUI thread: big enough for the
+# current card and the prefetch window (with slack for a resize), while
+# QPixmapCache holds visited cards under its byte limit
+@lru_cache(maxsize=2 * (_PREFETCH_AHEAD + 1))
+def _cached_image(path, member, width, height):
+    """Decode an image file (or a ZIP member when given) scaled to fit width x height
+
+    Uses QImage rather than QPixmap so prefetch workers can call it off the
+    GUI thread.
+    """
+    image = QImage()
+    if member:
+        image.loadFromData(_open_vocab_zip(path).read(member))
+    else:
+        image.load(path)
+    if image.isNull():
+        return image
+    return image.scaled(width, height, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+
+def _cached_pixmap(path, member, width, height):
+    """
+    GUI-thread pixmap for _cached_image; revisiting a card skips the decode.
+    Held in QPixmapCache, which bounds the cache by bytes rather than count.
+    """
+    key = f"flashcard:{path}|{member}@{width}x{height}"
+    pixmap = QPixmapCache.find(key)
+    if pixmap is None or pixmap.isNull():
+        pixmap = QPixmap.fromImage(_cached_image(path, member, width, height))
+        if not pixmap.isNull():
+            QPixmapCache.insert(key, pixmap)
+    return pixmap
+
+
+class _CardPrefetchTask(QRunnable):
+    """Decode an upcoming card's image and fetch its gTTS audio in the background"""
+
+    def __init__(self, cancel_event, image_args=None, tts_args=None):
+        super().__init__()
+        self.cancel_event = cancel_event  # Set when the dialog closes
+        self.image_args = image_args
+        self.tts_args = tts_args
+
+    def run(self):
+        try:
+            if self.image_args and not self.cancel_event.is_set():
+                _cached_image(*self.image_args)
+            # Checked again right before the (slow) network request
+            if self.tts_args and not self.cancel_event.is_set():
+                prefetch_gtts(*self.tts_args)
+        except Exception as e:
+            print(f"Card prefetch error: {e}")
+
+
+def _write_json_atomic(path, data):
+    """
+    Write data as indented UTF-8 JSON (via orjson when available).
+    The bytes go to a temporary file that then replaces path, so an
+    interrupted save never leaves a truncated progress file.
+    """
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(payload)
+    os.replace(tmp_path, path)
+
+
+# Progress writes from the GUI thread and from _ProgressSaveTask are
+# serialized, and a snapshot is dropped if a newer one is already on disk
+_progress_write_lock = threading.Lock()
+_progress_written_seq = {}  # storage path -> sequence number on disk
+_progress_save_seq = itertools.count(1)  # Shared by every FlashcardProgress
+
+
+def _write_progress_snapshot(path, data, seq):
+    """Write progress snapshot number seq unless a newer one was written"""
+    with _progress_write_lock:
+        if _progress_written_seq.get(path, 0) >= seq:
+            return
+        _write_json_atomic(path, data)
+        _progress_written_seq[path] = seq
+
+
+class _ProgressSaveTask(QRunnable):
+    """Serialize and write a progress snapshot off the GUI thread"""
+
+    def __init__(self, path, data, seq):
+        super().__init__()
+        self.path = path
+        self.data = data
+        self.seq = seq
+
+    def run(self):
+        try:
+            _write_progress_snapshot(self.path, self.data, self.seq)
+        except Exception as e:
+            print(f"Progress save error: {e}")
+
+
 class FlashcardSession:
     """Represents a single flashcard learning session"""
 
@@ -79,46 +261,168 @@ class FlashcardSession:
 class FlashcardProgress:
     """
     Manages user progress for flashcard learning
-    Implements spaced repetition algorithm
+    Schedules reviews with the FSRS spaced repetition model (core.srs_fsrs)
     """
 
-    def __init__(self, storage_path="Data/flashcard_progress.json"):
+    def __init__(
+        self,
+        storage_path="Data/flashcard_progress.json",
+        retention=srs_fsrs.DEFAULT_RETENTION,
+    ):
         self.storage_path = storage_path
+        self.retention = retention  # Target recall probability when due
         self.items = {}  # {item_id: progress_data}
+        # Min-heap of (next_review_ts, item_id). Entries are never removed on
+        # update; a popped entry is stale (and dropped) when its time no
+        # longer matches the item's next_review_ts
+        self._due_heap = []
+        # Per-item fields mirrored into parallel NumPy arrays (row =
+        # self._idx[id]) so get_statistics() and reschedule_all() work on
+        # whole columns instead of walking the item dicts
+        self._idx = {}
+        self._acc = np.zeros(0, dtype=np.float64)  # total_accuracy
+        self._att = np.zeros(0, dtype=np.int64)  # attempts
+        self._diff = np.zeros(0, dtype=np.int8)  # difficulty_level
+        self._reviewed_ts = np.zeros(0, dtype=np.float64)  # last_reviewed (epoch)
+        self._stab = np.zeros(0, dtype=np.float64)  # FSRS stability (days)
+        # Items whose ISO date strings lag behind their *_ts floats; the
+        # strings are only for people reading the JSON, so save() fills them
+        self._iso_stale = set()
+        # True when items changed since the last load/save
+        self._dirty = False
+        # Background saves (one writer thread)
+        self._save_pool = QThreadPool()
+        self._save_pool.setMaxThreadCount(1)
         self.load()
 
     def load(self):
         """Load progress from storage"""
         try:
-            with open(self.storage_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                self.items = data.get("items", {})
+            if orjson is not None:
+                data = orjson.loads(Path(self.storage_path).read_bytes())
+            else:
+                with open(self.storage_path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+            self.items = data.get("items", {})
         except FileNotFoundError:
             self.items = {}
-
-    def save(self):
-        """Save progress to storage"""
-        data = {"last_saved": datetime.now().isoformat(), "items": self.items}
-        with open(self.storage_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        for item in self.items.values():
+            # Progress saved before FSRS scheduling has no memory state
+            if "stability" not in item:
+                item["stability"], item["fsrs_difficulty"] = self._legacy_fsrs_state(
+                    item
+                )
+        self._build_due_index()
+        self._build_stat_arrays()
+        self._iso_stale.clear()
+        self._dirty = False
+
+    def _build_due_index(self):
+        """Rebuild the due-time heap from self.items"""
+        for item in self.items.values():
+            # Progress saved before next_review_ts existed only has the ISO form
+            if "next_review_ts" not in item:
+                item["next_review_ts"] = datetime.fromisoformat(
+                    item["next_review"]
+                ).timestamp()
+        self._due_heap = [
+            (item["next_review_ts"], item_id) for item_id, item in self.items.items()
+        ]
+        heapq.heapify(self._due_heap)
+
+    def save(self, background=False):
+        """
+        Save progress to storage (skipped when nothing has changed).
+        With background=True, a snapshot is written on a worker thread;
+        call wait_for_saves() before exiting.
+        """
+        if not self._dirty:
+            return
+        for item_id in self._iso_stale:
+            item = self.items[item_id]
+            for field in ("created", "last_reviewed", "next_review"):
+                ts = item.get(f"{field}_ts")
+                if ts is not None:
+                    item[field] = datetime.fromtimestamp(ts).isoformat()
+        self._iso_stale.clear()
+        items = self.items
+        if background:
+            # update_item mutates the item dicts in place, so the worker
+            # gets its own copies
+            items = {item_id: dict(item) for item_id, item in items.items()}
+        data = {"last_saved": datetime.now().isoformat(), "items": items}
+        seq = next(_progress_save_seq)
+        if background:
+            self._save_pool.start(_ProgressSaveTask(self.storage_path, data, seq))
+        else:
+            _write_progress_snapshot(self.storage_path, data, seq)
+        self._dirty = False
+
+    def wait_for_saves(self):
+        """Block until background saves have reached disk"""
+        self._save_pool.waitForDone()
+
+    def _build_stat_arrays(self):
+        """Rebuild the statistics arrays from self.items"""
+        self._idx = {item_id: i for i, item_id in enumerate(self.items)}
+        capacity = max(16, len(self.items))
+        self._acc = np.zeros(capacity, dtype=np.float64)
+        self._att = np.zeros(capacity, dtype=np.int64)
+        self._diff = np.zeros(capacity, dtype=np.int8)
+        self._reviewed_ts = np.zeros(capacity, dtype=np.float64)
+        self._stab = np.zeros(capacity, dtype=np.float64)
+        for item_id, i in self._idx.items():
+            self._store_stats(i, self.items[item_id])
+
+    def _grow_stat_arrays(self):
+        """Double the capacity of the statistics arrays; new rows are zero"""
+        capacity = 2 * len(self._acc)
+        for name in ("_acc", "_att", "_diff", "_reviewed_ts", "_stab"):
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[: len(old)] = old
+            setattr(self, name, new)
+
+    def _store_stats(self, i, item):
+        """Copy one item's statistics into row i of the arrays"""
+        self._acc[i] = item["total_accuracy"]
+        self._att[i] = item["attempts"]
+        self._diff[i] = item["difficulty_level"]
+        reviewed_ts = item.get("last_reviewed_ts")
+        if reviewed_ts is None:
+            # Progress saved before the *_ts fields existed
+            reviewed_ts = datetime.fromisoformat(
+                item["last_reviewed"] or item["created"]
+            ).timestamp()
+        self._reviewed_ts[i] = reviewed_ts
+        self._stab[i] = item["stability"]
 
     def update_item(self, item_id, was_correct, accuracy_score):
         """Update progress for an item"""
+        now_ts = time.time()
+        i = self._idx.get(item_id)
+        # Days since the previous review (row value; a Python float for FSRS)
+        elapsed_days = 0.0 if i is None else (now_ts - float(self._reviewed_ts[i])) / 86400.0
         if item_id not in self.items:
             self.items[item_id] = {
-                "created": datetime.now().isoformat(),
+                "created": None,
+                "created_ts": now_ts,
                 "attempts": 0,
                 "correct_count": 0,
                 "total_accuracy": 0,
                 "last_reviewed": None,
-                "next_review": datetime.now().isoformat(),
+                "next_review": None,
+                "next_review_ts": now_ts,
                 "difficulty_level": 1,  # 1-5
                 "streak": 0,
+                "stability": None,  # FSRS state, set by the first review
+                "fsrs_difficulty": None,
             }
 
         item = self.items[item_id]
+        self._dirty = True
         item["attempts"] += 1
-        item["last_reviewed"] = datetime.now().isoformat()
+        item["last_reviewed_ts"] = now_ts
         item["total_accuracy"] += accuracy_score
 
         if was_correct:
@@ -130,40 +434,90 @@ class FlashcardProgress:
             item["difficulty_level"] = max(1, item["difficulty_level"] - 1)
 
         # Calculate next review (spaced repetition)
+        rating = srs_fsrs.GOOD if was_correct else srs_fsrs.AGAIN
+        item["stability"], item["fsrs_difficulty"] = srs_fsrs.review(
+            item["stability"], item["fsrs_difficulty"], elapsed_days, rating
+        )
         days_until_review = self._calculate_review_interval(item)
-        item["next_review"] = (
-            datetime.now() + timedelta(days=days_until_review)
-        ).isoformat()
+        item["next_review_ts"] = now_ts + days_until_review * 86400.0
+        self._iso_stale.add(item_id)
+        heapq.heappush(self._due_heap, (item["next_review_ts"], item_id))
+
+        if i is None:
+            i = self._idx[item_id] = len(self._idx)
+            if i >= len(self._acc):
+                self._grow_stat_arrays()
+        self._store_stats(i, item)
 
     def _calculate_review_interval(self, item):
-        """Calculate days until next review based on performance"""
+        """Calculate days until next review from the item's FSRS stability"""
+        return srs_fsrs.interval_days(item["stability"], self.retention)
+
+    @staticmethod
+    def _legacy_fsrs_state(item):
+        """
+        Seed FSRS (stability, difficulty) for an item scheduled by the old
+        interval ladder: its last interval becomes the stability, and
+        difficulty_level 1-5 (5 = easiest) maps onto FSRS difficulty 9-1
+        """
         streak = item["streak"]
         difficulty = item["difficulty_level"]
 
-        # Base intervals in days
-        intervals = [1, 3, 7, 14, 30]
-
         # Adjust based on streak and difficulty
-        base_index = min(streak, len(intervals) - 1)
-        interval = intervals[base_index]
+        base_index = min(streak, len(_REVIEW_INTERVALS) - 1)
+        interval = _REVIEW_INTERVALS[base_index]
 
         # Reduce interval for difficult items
         if difficulty <= 2:
             interval = max(1, interval // 2)
 
-        return interval
+        return float(interval), float(11 - 2 * difficulty)
+
+    def reschedule_all(self):
+        """
+        Recompute every item's next review from its last review date.
+        Same rule as _calculate_review_interval, applied to all items as
+        array operations.
+        """
+        if not self.items:
+            return
+        # Rows are assigned in insertion order, so row i belongs to ids[i]
+        ids = list(self._idx)
+        n = len(ids)
+
+        intervals = np.clip(
+            np.rint(srs_fsrs.next_interval(self._stab[:n], self.retention)),
+            1,
+            srs_fsrs.MAX_INTERVAL_DAYS,
+        )
+        next_ts = self._reviewed_ts[:n] + intervals * 86400.0
+
+        for item_id, ts in zip(ids, next_ts.tolist()):
+            self.items[item_id]["next_review_ts"] = ts
+        self._iso_stale.update(ids)
+        self._build_due_index()
+        self._dirty = True
 
     def get_due_items(self, vocab_list):
         """Get items that are due for review"""
-        now = datetime.now().isoformat()
+        now_ts = time.time()
+
+        # Pop only the entries that are due (or stale), then push the live
+        # ones back so the index survives for the next call
+        due_ids = set()
+        while self._due_heap and self._due_heap[0][0] <= now_ts:
+            ts, item_id = heapq.heappop(self._due_heap)
+            if self.items[item_id]["next_review_ts"] == ts:
+                due_ids.add(item_id)
+        for item_id in due_ids:
+            heapq.heappush(self._due_heap, (self.items[item_id]["next_review_ts"], item_id))
+
         due = []
         for item in vocab_list:
-            item_id = item.get("reference", str(item))
-            if item_id in self.items:
-                if self.items[item_id]["next_review"] <= now:
-                    due.append(item)
-            else:
-                due.append(item)  # New items are always due
+            item_id = _item_id(item)
+            # New items are always due
+            if item_id in due_ids or item_id not in self.items:
+                due.append(item)
         return due
 
     def get_statistics(self):
@@ -177,17 +531,11 @@ class FlashcardProgress:
             }
 
         total = len(self.items)
-        mastered = sum(
-            1 for item in self.items.values() if item["difficulty_level"] >= 4
-        )
-        avg_accuracy = (
-            sum(
-                item["total_accuracy"] / item["attempts"]
-                for item in self.items.values()
-                if item["attempts"] > 0
-            )
-            / total
-        )
+        acc = self._acc[:total]
+        att = self._att[:total]
+        mastered = int((self._diff[:total] >= 4).sum())
+        # Items never attempted count as 0% (their total_accuracy is 0)
+        avg_accuracy = float((acc / np.maximum(att, 1)).mean())
 
         return {
             "total_items": total,
@@ -205,22 +553,54 @@ class FlashcardDialog(QDialog):
 
     session_completed = pyqtSignal(dict)
 
+    # Pronunciation feedback bar stylesheets, one per accuracy band
+    _PROGRESS_SS = {
+        color: f"""
+            QProgressBar {{
+                border: 2px solid grey;
+                border-radius: 5px;
+                text-align: center;
+                color: black;
+            }}
+            QProgressBar::chunk {{
+                background-color: {color};
+                width: 1px;
+            }}
+        """
+        for color in ("green", "yellow", "red")
+    }
+
     def __init__(self, vocab_data, config, parent=None, vocab_file_path=None):
         super().__init__(parent)
         self.vocab_data = vocab_data
         self.config = config
         self.vocab_file_path = vocab_file_path
         self.progress = FlashcardProgress(storage_path="Data/flashcard_progress.json")
+        # Ratings arrive in bursts; write progress once things go quiet
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(_PROGRESS_SAVE_DELAY_MS)
+        self._save_timer.timeout.connect(
+            lambda: self.progress.save(background=True)
+        )
         self.session = None
         self.current_card = None
+        self.current_item = None
         self.showing_front = True  # True = word, False = definition
 
         # Cache for default logo image
         self.default_logo_pixmap = None
+        # Room for the scaled card images (KiB); Qt's default is 10 MiB
+        QPixmapCache.setCacheLimit(max(QPixmapCache.cacheLimit(), 20 * 1024))
 
         # TTS thread (engine created on demand via TTSThread)
         self.tts_thread = None
 
+        # Background workers that prepare the next few cards
+        self._prefetch_pool = QThreadPool(self)
+        self._prefetch_pool.setMaxThreadCount(2)
+        self._prefetch_cancel = threading.Event()
+
         # Initialize recording attributes
         self.record_thread = None
         self.recorded_file = None
@@ -232,6 +612,7 @@ class FlashcardDialog(QDialog):
         self.asr_thread = None
         self.pronunciation_data = None
         self.has_pronunciation_feedback = False
+        self._last_progress_ss = None
 
         # Back card TTS buttons
         self.back_play_tts_btn = None
@@ -269,7 +650,7 @@ class FlashcardDialog(QDialog):
 
         self.enable_image_cb = QCheckBox("Enable Image")
         self.enable_image_cb.setChecked(True)
-        # self.enable_image_cb.toggled.connect(self.toggle_image_display) # Removed old connection
+        self.enable_image_cb.toggled.connect(self._on_image_toggle)
         front_top_layout.addWidget(self.enable_image_cb)
 
         front_top_layout.addStretch()
@@ -523,12 +904,17 @@ class FlashcardDialog(QDialog):
 
     def start_session(self):
         """Initialize a new flashcard session"""
-        vocab = self.vocab_data.copy()
+        # Card order as indices into self.vocab_data (the deck is not copied)
+        n = len(self.vocab_data)
         if self.shuffle_cards:
-            random.shuffle(vocab)
+            self._order = np.random.default_rng().permutation(n).tolist()
+        else:
+            self._order = list(range(n))
 
-        self.session = FlashcardSession(vocab)
+        self.session = FlashcardSession(self.vocab_data)
         self.current_card = 0
+        # Progress keys parallel to self.vocab_data
+        self._item_ids = [_item_id(item) for item in self.vocab_data]
         self.show_card()
         self.update_stats()
 
@@ -545,7 +931,7 @@ class FlashcardDialog(QDialog):
             self.finish_session()
             return
 
-        item = self.vocab_data[self.current_card]
+        item = self.vocab_data[self._order[self.current_card]]
         self.showing_front = True
         self.front_card_group.show()
         self.back_card_group.hide()
@@ -555,16 +941,6 @@ class FlashcardDialog(QDialog):
         self.front_word_label.setText(front)
         self.pronunciation_label.setText(item.get("ipa_pronunciation", ""))
 
-        # Disconnect any previous connections to avoid multiple calls
-        try:
-            self.enable_image_cb.toggled.disconnect()
-        except TypeError:
-            pass  # No connection to disconnect
-
-        # Connect the checkbox to the image display logic, passing the current item
-        self.enable_image_cb.toggled.connect(
-            lambda state: self.toggle_image_display(state, item)
-        )
         # Handle image display initially based on checkbox state and current item
         self.toggle_image_display(self.enable_image_cb.isChecked(), item)
 
@@ -590,6 +966,42 @@ class FlashcardDialog(QDialog):
         # Store item for flip
         self.current_item = item
 
+        self.prefetch_upcoming_cards()
+
+    def prefetch_upcoming_cards(self):
+        """
+        Queue gTTS downloads for the current and next few cards, and image
+        decoding for the next few (the current image is already shown)
+        """
+        # Work queued for cards the user has moved past is no longer useful
+        self._prefetch_pool.clear()
+        load_images = self.enable_image_cb.isChecked()
+        lang_code = None
+        if self.config.get("tts_engine", "gTTS") == "gTTS":
+            lang_code = tts_language_code(self.config["language"])
+        if not load_images and lang_code is None:
+            return
+
+        size = self._image_target_size()
+        upcoming = self._order[
+            self.current_card : self.current_card + 1 + _PREFETCH_AHEAD
+        ]
+        for offset, index in enumerate(upcoming):
+            item = self.vocab_data[index]
+            image_args = None
+            if offset and load_images and item.get("image_filename"):
+                source = self._image_source(item["image_filename"])
+                if source:
+                    image_args = (*source, *size)
+            tts_args = None
+            text = item.get("reference", "").strip()
+            if lang_code and text:
+                tts_args = ([text], lang_code)
+            if image_args or tts_args:
+                self._prefetch_pool.start(
+                    _CardPrefetchTask(self._prefetch_cancel, image_args, tts_args)
+                )
+
     def flip_card(self):
         """Flip the card to show the back side"""
         if self.showing_front and self.current_item:
@@ -629,14 +1041,16 @@ class FlashcardDialog(QDialog):
     def rate_difficulty(self, rating):
         """Rate the difficulty of the current card"""
         if self.current_card < len(self.vocab_data):
-            item = self.vocab_data[self.current_card]
-            item_id = item.get("reference", str(item))
+            index = self._order[self.current_card]
+            item = self.vocab_data[index]
+            item_id = self._item_ids[index]
 
             was_correct = rating >= 3
             accuracy = 100 if was_correct else 50
 
             self.progress.update_item(item_id, was_correct, accuracy)
             self.session.record_attempt(item, was_correct, accuracy)
+            self._save_timer.start()
 
         self.next_card()
 
@@ -674,7 +1088,7 @@ class FlashcardDialog(QDialog):
 
         engine_name = self.config.get("tts_engine", "gTTS")
         voice = self.config.get("tts_voice") if engine_name == "edge-tts" else None
-        lang_code = self.config["language"].split("-")[0].lower()
+        lang_code = tts_language_code(self.config["language"])
 
         # Normalize polytonic Greek for edge-tts if enabled
         if (
@@ -705,7 +1119,7 @@ class FlashcardDialog(QDialog):
 
         engine_name = self.config.get("tts_engine", "gTTS")
         voice = self.config.get("tts_voice") if engine_name == "edge-tts" else None
-        lang_code = self.config["language"].split("-")[0].lower()
+        lang_code = tts_language_code(self.config["language"])
 
         # Normalize polytonic Greek for edge-tts if enabled
         if (
@@ -765,7 +1179,8 @@ class FlashcardDialog(QDialog):
             return
 
         try:
-            data, samplerate = sf.read(self.audio_file)
+            # Decode once per recording; replays reuse the array
+            data, samplerate = _load_recording(self.audio_file)
             sd.play(data, samplerate)
 
             # After playing, automatically convert the audio for pronunciation feedback
@@ -847,27 +1262,27 @@ class FlashcardDialog(QDialog):
             color = "red"
             status = "Needs Improvement"
 
-        # Update progress bar color (using stylesheet)
-        self.feedback_progress.setStyleSheet(f"""
-            QProgressBar {{
-                border: 2px solid grey;
-                border-radius: 5px;
-                text-align: center;
-                color: black;
-            }}
-            QProgressBar::chunk {{
-                background-color: {color};
-                width: 1px;
-            }}
-        """)
-
-        # Generate detailed feedback text
-        feedback = f"=== PRONUNCIATION FEEDBACK ===\n\n"
-        feedback += f"Overall Accuracy: {accuracy:.1f}% - {status}\n"
-        feedback += f"Threshold: 80%\n\n"
-        feedback += f"Reference: {pron_data['reference']}\n\n"
-        feedback += f"Recognized: {pron_data['recognized']}\n\n"
-        feedback += "=== WORD-BY-WORD ANALYSIS ===\n\n"
+        # Update progress bar color; setStyleSheet re-parses and re-polishes,
+        # so only call it when the color band changes
+        ss = self._PROGRESS_SS[color]
+        if ss != self._last_progress_ss:
+            self.feedback_progress.setStyleSheet(ss)
+            self._last_progress_ss = ss
+
+        # Generate detailed feedback text (collected as lines, joined once)
+        lines = [
+            "=== PRONUNCIATION FEEDBACK ===",
+            "",
+            f"Overall Accuracy: {accuracy:.1f}% - {status}",
+            "Threshold: 80%",
+            "",
+            f"Reference: {pron_data['reference']}",
+            "",
+            f"Recognized: {pron_data['recognized']}",
+            "",
+            "=== WORD-BY-WORD ANALYSIS ===",
+            "",
+        ]
 
         word_analysis = pron_data.get("word_analysis", [])
         correct_count = 0
@@ -880,20 +1295,23 @@ class FlashcardDialog(QDialog):
 
             if status == "correct":
                 correct_count += 1
-                feedback += f"{i}. ✓ '{ref}' → '{rec}' ({sim:.1f}%)\n"
+                lines.append(f"{i}. ✓ '{ref}' → '{rec}' ({sim:.1f}%)")
             elif status == "incorrect":
-                feedback += f"{i}. ✗ '{ref}' → '{rec}' ({sim:.1f}%) - Mispronounced\n"
+                lines.append(f"{i}. ✗ '{ref}' → '{rec}' ({sim:.1f}%) - Mispronounced")
             elif status == "missing":
-                feedback += f"{i}. ✗ '{ref}' → [MISSING]\n"
+                lines.append(f"{i}. ✗ '{ref}' → [MISSING]")
             elif status == "extra":
-                feedback += f"{i}. ⚠ [EXTRA] → '{rec}'\n"
+                lines.append(f"{i}. ⚠ [EXTRA] → '{rec}'")
 
         total = len(word_analysis)
-        feedback += f"\n=== SUMMARY ===\n"
-        feedback += f"Correct: {correct_count}/{total}\n"
-        feedback += (
-            f"Accuracy: {(correct_count / total * 100) if total > 0 else 0:.1f}%\n"
-        )
+        lines += [
+            "",
+            "=== SUMMARY ===",
+            f"Correct: {correct_count}/{total}",
+            f"Accuracy: {(correct_count / total * 100) if total > 0 else 0:.1f}%",
+            "",
+        ]
+        feedback = "\n".join(lines)
 
         # Display the feedback text
         self.pronunciation_feedback_text.setPlainText(feedback)
@@ -925,99 +1343,65 @@ class FlashcardDialog(QDialog):
         else:
             self.mnemonics_text.hide()
 
+    def _on_image_toggle(self, state):
+        """Apply the image checkbox to whichever card is showing"""
+        self.toggle_image_display(state, self.current_item)
+
     def toggle_image_display(self, enabled, item=None):
         if enabled:
             if item and item.get("image_filename"):
                 self.load_vocabulary_image(item.get("image_filename"))
             else:
                 # Use default logo instead of text
-                default_pixmap = self.load_default_logo()
-                if default_pixmap and not default_pixmap.isNull():
-                    self.image_label.setPixmap(
-                        default_pixmap.scaled(
-                            self.image_label.width() - 2,
-                            self.image_label.height() - 2,
-                            Qt.KeepAspectRatio,
-                            Qt.SmoothTransformation,
-                        )
-                    )
-                else:
-                    self.image_label.setText("No Image")
-                    self.image_label.setPixmap(QPixmap())  # Clear pixmap
+                self.show_default_logo("No Image")
         else:
             self.image_label.setText("Image disabled")
             self.image_label.setPixmap(QPixmap())  # Clear pixmap
 
+    def _image_target_size(self):
+        """Size the image label can show without clipping the border"""
+        return self.image_label.width() - 2, self.image_label.height() - 2
+
+    def show_default_logo(self, fallback_text):
+        """Show the scaled default logo, or fallback_text if there is none"""
+        pixmap = QPixmap()
+        if self.load_default_logo() is not None:
+            pixmap = _cached_pixmap(_DEFAULT_LOGO_PATH, "", *self._image_target_size())
+        if not pixmap.isNull():
+            self.image_label.setPixmap(pixmap)
+        else:
+            self.image_label.setText(fallback_text)
+            self.image_label.setPixmap(QPixmap())  # Clear pixmap
+
+    def _image_source(self, image_filename):
+        """Return (path, ZIP member or "") for a card image, or None if not found"""
+        if not self.vocab_file_path:
+            return None
+        # Implementation depends on whether image is in ZIP or filesystem
+        if self.vocab_file_path.endswith(".zip"):
+            member = _zip_image_index(self.vocab_file_path).get(
+                Path(image_filename).stem
+            )
+            return (self.vocab_file_path, member) if member else None
+        image_path = Path(self.vocab_file_path).parent / image_filename
+        return (str(image_path), "") if image_path.exists() else None
+
     def load_vocabulary_image(self, image_filename):
         """Load and display vocabulary image"""
         try:
-            # Implementation depends on whether image is in ZIP or filesystem
-            if self.vocab_file_path and self.vocab_file_path.endswith(".zip"):
-                import zipfile
-
-                with zipfile.ZipFile(self.vocab_file_path, "r") as zip_file:
-                    # Try to find image
-                    base = Path(image_filename).stem
-                    for name in zip_file.namelist():
-                        if Path(name).stem == base:
-                            image_data = zip_file.read(name)
-                            pixmap = QPixmap()
-                            pixmap.loadFromData(image_data)
-                            if not pixmap.isNull():
-                                self.image_label.setPixmap(
-                                    pixmap.scaled(
-                                        self.image_label.width() - 2,
-                                        self.image_label.height() - 2,
-                                        Qt.KeepAspectRatio,
-                                        Qt.SmoothTransformation,
-                                    )
-                                )
-                            return
-            else:
-                # Load from filesystem
-                if self.vocab_file_path:
-                    image_path = Path(self.vocab_file_path).parent / image_filename
-                    if image_path.exists():
-                        pixmap = QPixmap(str(image_path))
-                        if not pixmap.isNull():
-                            self.image_label.setPixmap(
-                                pixmap.scaled(
-                                    self.image_label.width() - 2,
-                                    self.image_label.height() - 2,
-                                    Qt.KeepAspectRatio,
-                                    Qt.SmoothTransformation,
-                                )
-                            )
-                            return
-                    else:
-                        # Image file not found - use default logo
-                        default_pixmap = self.load_default_logo()
-                        if default_pixmap and not default_pixmap.isNull():
-                            self.image_label.setPixmap(
-                                default_pixmap.scaled(
-                                    self.image_label.width() - 2,
-                                    self.image_label.height() - 2,
-                                    Qt.KeepAspectRatio,
-                                    Qt.SmoothTransformation,
-                                )
-                            )
-                        return
+            source = self._image_source(image_filename)
+            if source:
+                pixmap = _cached_pixmap(*source, *self._image_target_size())
+                if not pixmap.isNull():
+                    self.image_label.setPixmap(pixmap)
+            elif self.vocab_file_path and not self.vocab_file_path.endswith(".zip"):
+                # Image file not found - use default logo
+                self.show_default_logo("No Image")
 
         except Exception as e:
             print(f"Image load error: {e}")
             # Fallback to default logo
-            default_pixmap = self.load_default_logo()
-            if default_pixmap and not default_pixmap.isNull():
-                self.image_label.setPixmap(
-                    default_pixmap.scaled(
-                        self.image_label.width() - 2,
-                        self.image_label.height() - 2,
-                        Qt.KeepAspectRatio,
-                        Qt.SmoothTransformation,
-                    )
-                )
-            else:
-                self.image_label.setText("Image load error")
+            self.show_default_logo("Image load error")
 
     def load_default_logo(self):
         """Load and cache the default logo image"""
@@ -1026,9 +1410,8 @@ class FlashcardDialog(QDialog):
             return self.default_logo_pixmap
 
         try:
-            logo_path = Path("Data") / "Logo.png"
-            if logo_path.exists():
-                pixmap = QPixmap(str(logo_path))
+            if os.path.exists(_DEFAULT_LOGO_PATH):
+                pixmap = QPixmap(_DEFAULT_LOGO_PATH)
                 if not pixmap.isNull():
                     # Cache the original pixmap (unscaled)
                     self.default_logo_pixmap = pixmap
@@ -1098,6 +1481,7 @@ class FlashcardDialog(QDialog):
 
     def finish_session(self):
         """Complete the session and save progress"""
+        self._save_timer.stop()
         self.progress.save()
         if self.session:
             self.session_completed.emit(self.session.get_statistics())
@@ -1105,6 +1489,14 @@ class FlashcardDialog(QDialog):
     def closeEvent(self, event):
         """Handle dialog close"""
         self.finish_session()
+        # Stop prefetching; a task already inside a gTTS request is not
+        # waited for beyond a short bound
+        self._prefetch_cancel.set()
+        self._prefetch_pool.clear()
+        if self._prefetch_pool.waitForDone(_PREFETCH_CLOSE_WAIT_MS):
+            # Only close the ZIP handles once no task can still be reading
+            _close_vocab_zips()
+        self.progress.wait_for_saves()
         event.accept()
 
 
@@ -38,10 +38,10 @@ from PyQt5.QtCore import Qt, pyqtSignal, QTimer
 from PyQt5.QtGui import QIcon, QFont, QPixmap
 
 # Import modular components
-from config import ConfigDialog, DEFAULT_CONFIG
+from config import ConfigDialog, DEFAULT_CONFIG, to_mutable
 from core.recorder import RecordThread
-from core.asr_engines import ASRThread
-from core.tts_engines import TTSThread
+from core.asr_engines import ASRThread, prewarm_model
+from core.tts_engines import TTSThread, tts_language_code
 from utils.text_processing import (
     normalize_text,
     clean_ai_response,
@@ -71,7 +71,7 @@ class ASRApp(QMainWindow):
         super().__init__()
         self.audio_file = None
         self.recorded_file = None
-        self.config = DEFAULT_CONFIG.copy()
+        self.config = to_mutable(DEFAULT_CONFIG)
         self.pronunciation_data = None
 
         # Vocabulary file handling attributes
@@ -90,6 +90,9 @@ class ASRApp(QMainWindow):
         # Flashcard progress
         self.flashcard_progress = FlashcardProgress()
 
+        # Configuration dialog (created on demand)
+        self.config_dialog = None
+
         self.init_ui()
 
     def init_ui(self):
@@ -741,18 +744,23 @@ class ASRApp(QMainWindow):
             self.word_time_cb.isChecked(),
             reference,
         )
+        self.asr_thread.transcription_ready.connect(self.show_transcription)
         self.asr_thread.finished.connect(self.on_asr_finished)
         self.asr_thread.error.connect(self.on_error)
         self.asr_thread.start()
 
-    def on_asr_finished(self, text, metadata):
-        """Handle ASR completion"""
+    def show_transcription(self, text, metadata):
+        """Display recognized text (and word timestamps, if any)"""
         result = text
         if "word_times" in metadata:
             result += "\n\n--- Word Timestamps ---\n" + metadata["word_times"]
 
         self.output_text.setText(result)
 
+    def on_asr_finished(self, text, metadata):
+        """Handle ASR completion"""
+        self.show_transcription(text, metadata)
+
         # Handle pronunciation feedback
         if metadata and "pronunciation" in metadata:
             self.pronunciation_data = metadata["pronunciation"]
@@ -792,13 +800,20 @@ class ASRApp(QMainWindow):
 
         self.accuracy_label.setStyleSheet(f"color: {color};")
 
-        # Generate detailed feedback
-        feedback = f"=== PRONUNCIATION FEEDBACK ===\n\n"
-        feedback += f"Overall Accuracy: {accuracy:.1f}% - {status}\n"
-        feedback += f"Threshold: {threshold}%\n\n"
-        feedback += f"Reference: {pron_data['reference']}\n\n"
-        feedback += f"Recognized: {pron_data['recognized']}\n\n"
-        feedback += "=== WORD-BY-WORD ANALYSIS ===\n\n"
+        # Generate detailed feedback (collected as lines, joined once)
+        lines = [
+            "=== PRONUNCIATION FEEDBACK ===",
+            "",
+            f"Overall Accuracy: {accuracy:.1f}% - {status}",
+            f"Threshold: {threshold}%",
+            "",
+            f"Reference: {pron_data['reference']}",
+            "",
+            f"Recognized: {pron_data['recognized']}",
+            "",
+            "=== WORD-BY-WORD ANALYSIS ===",
+            "",
+        ]
 
         word_analysis = pron_data.get("word_analysis", [])
         correct_count = 0
@@ -811,20 +826,23 @@ class ASRApp(QMainWindow):
 
             if status == "correct":
                 correct_count += 1
-                feedback += f"{i}. ✓ '{ref}' → '{rec}' ({sim:.1f}%)\n"
+                lines.append(f"{i}. ✓ '{ref}' → '{rec}' ({sim:.1f}%)")
             elif status == "incorrect":
-                feedback += f"{i}. ✗ '{ref}' → '{rec}' ({sim:.1f}%) - Mispronounced\n"
+                lines.append(f"{i}. ✗ '{ref}' → '{rec}' ({sim:.1f}%) - Mispronounced")
             elif status == "missing":
-                feedback += f"{i}. ✗ '{ref}' → [MISSING]\n"
+                lines.append(f"{i}. ✗ '{ref}' → [MISSING]")
             elif status == "extra":
-                feedback += f"{i}. ⚠ [EXTRA] → '{rec}'\n"
+                lines.append(f"{i}. ⚠ [EXTRA] → '{rec}'")
 
         total = len(word_analysis)
-        feedback += f"\n=== SUMMARY ===\n"
-        feedback += f"Correct: {correct_count}/{total}\n"
-        feedback += (
-            f"Accuracy: {(correct_count / total * 100) if total > 0 else 0:.1f}%\n"
-        )
+        lines += [
+            "",
+            "=== SUMMARY ===",
+            f"Correct: {correct_count}/{total}",
+            f"Accuracy: {(correct_count / total * 100) if total > 0 else 0:.1f}%",
+            "",
+        ]
+        feedback = "\n".join(lines)
 
         self.feedback_text.setText(feedback)
         self.tabs.setCurrentIndex(1)
@@ -840,7 +858,7 @@ class ASRApp(QMainWindow):
 
         engine_name = self.config.get("tts_engine", "gTTS")
         voice = self.config.get("tts_voice") if engine_name == "edge-tts" else None
-        lang_code = self.config["language"].split("-")[0].lower()
+        lang_code = tts_language_code(self.config["language"])
 
         # Normalize polytonic Greek for edge-tts if enabled
         if (
@@ -873,7 +891,7 @@ class ASRApp(QMainWindow):
 
         engine_name = self.config.get("tts_engine", "gTTS")
         voice = self.config.get("tts_voice") if engine_name == "edge-tts" else None
-        lang_code = self.config["language"].split("-")[0].lower()
+        lang_code = tts_language_code(self.config["language"])
 
         # Normalize polytonic Greek for edge-tts if enabled
         if (
@@ -1023,11 +1041,24 @@ class ASRApp(QMainWindow):
 
     def show_config(self):
         """Show configuration dialog"""
-        dialog = ConfigDialog(self, self.config)
+        # Build the dialog once and reuse it; only the control values change
+        if self.config_dialog is None:
+            self.config_dialog = ConfigDialog(self, self.config)
+        else:
+            self.config_dialog.current_config = self.config
+            self.config_dialog.set_config(self.config)
+        dialog = self.config_dialog
         if dialog.exec_() == dialog.Accepted:
             self.config = dialog.get_config()
+            self.prewarm_asr_model()
             QMessageBox.information(self, "Configuration", "Settings updated!")
 
+    def prewarm_asr_model(self):
+        """Load the selected ASR engine's model in the background"""
+        threading.Thread(
+            target=prewarm_model, args=(dict(self.config),), daemon=True
+        ).start()
+
     def show_help(self):
         """Show help dialog"""
         help_text = """ASR Application Help